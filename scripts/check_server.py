@@ -1,15 +1,31 @@
 #!/usr/bin/env python
 """Quick script to check server status and view recent activity."""
 
+import orjson
 import requests
-import json
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
-def main():
+STATUS_URL = "http://localhost:8000/api/status"
+
+
+def make_session() -> requests.Session:
+    """Session with a single pooled keep-alive connection for repeated polling."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = make_session()
+
+
+def main(session: requests.Session = _session):
     try:
         # Check server status
-        resp = requests.get("http://localhost:8000/api/status", timeout=2)
-        status = resp.json()
+        resp = session.get(STATUS_URL, timeout=2)
+        status = orjson.loads(resp.content)
         
         print("=" * 60)
         print("AERS Server Status")
@@ -5,12 +5,21 @@ from __future__ import annotations
 
 import argparse
 import sys
+import threading
+import time
 from pathlib import Path
 
 from aers.utils.config_loader import load_routing_config
 from aers.core.graph_engine import GraphEngine
 
 
+def _report_progress(stop_event: threading.Event, start_time: float) -> None:
+    """Print elapsed time once a second, keeping console I/O off the DSP loop."""
+    while not stop_event.wait(1.0):
+        elapsed = time.monotonic() - start_time
+        print(f"Running... {elapsed:.1f}s", end='\r', file=sys.stderr, flush=True)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run AERS audio routing with real audio I/O."
@@ -58,13 +67,20 @@ def main() -> int:
     print("Press Ctrl+C to stop...")
     print()
 
+    stop_progress = threading.Event()
+
     try:
-        import time
         frame_duration = routing.frame_size / float(routing.sample_rate)
         num_frames_total = int(args.duration / frame_duration) if args.duration > 0 else None
         
         frame_index = 0
-        start_time = time.time()
+        start_time = time.monotonic()
+        pace_start = start_time
+        threading.Thread(
+            target=_report_progress,
+            args=(stop_progress, start_time),
+            daemon=True,
+        ).start()
         
         while True:
             if num_frames_total and frame_index >= num_frames_total:
@@ -73,15 +89,18 @@ def main() -> int:
             # Process one frame
             outputs = engine.process_frame(frame_index)
             
-            # Print progress every second
-            if frame_index % int(1.0 / frame_duration) == 0:
-                elapsed = time.time() - start_time
-                print(f"Running... {elapsed:.1f}s", end='\r')
-            
             frame_index += 1
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(frame_duration * 0.1)
+            # Sleep until this frame's deadline; pacing against a fixed anchor
+            # keeps the loop from drifting as processing time varies.
+            next_deadline = pace_start + frame_index * frame_duration
+            delay = next_deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -frame_duration:
+                # More than a block behind (e.g. a stall): re-anchor instead of
+                # running back-to-back blocks until the backlog is caught up.
+                pace_start = time.monotonic() - frame_index * frame_duration
             
     except KeyboardInterrupt:
         print("\n\nStopped by user.")
@@ -90,6 +109,8 @@ def main() -> int:
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        stop_progress.set()
 
     print("\nDone.")
     return 0
@@ -4,10 +4,29 @@
 from __future__ import annotations
 
 import argparse
+import os
 
 import uvicorn
 
 
+def _pick_loop() -> str:
+    """Prefer uvloop (installed with uvicorn[standard]); fall back to asyncio."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "auto"
+    return "uvloop"
+
+
+def _pick_http() -> str:
+    """Prefer the httptools parser (installed with uvicorn[standard])."""
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        return "auto"
+    return "httptools"
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Run the AERS metrics server (FastAPI + WebSocket)."
@@ -29,6 +48,16 @@ def main() -> None:
         action="store_true",
         help="Enable auto-reload (development only).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("AERS_WORKERS", "1")),
+        help=(
+            "Worker processes (default: $AERS_WORKERS or 1). Each worker runs "
+            "its own simulation and serves only its own clients and uploads; "
+            "ignored with --reload."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -37,6 +66,9 @@ def main() -> None:
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=None if args.reload else args.workers,
+        loop=_pick_loop(),
+        http=_pick_http(),
     )
 
 
@@ -27,6 +27,13 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=1,
         help="Number of processing blocks to run.",
     )
+    parser.add_argument(
+        "--block-multiplier",
+        "-b",
+        type=int,
+        default=1,
+        help="Process this many blocks per node call (offline batching; default: 1).",
+    )
     return parser.parse_args(argv)
 
 
@@ -49,7 +56,10 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     # Track all nodes by default
-    last_frames = engine.run(num_frames=args.frames)
+    if args.block_multiplier > 1:
+        last_frames = engine.run_batched(num_frames=args.frames, block_multiplier=args.block_multiplier)
+    else:
+        last_frames = engine.run(num_frames=args.frames)
 
     for node_id, frame in last_frames.items():
         print(
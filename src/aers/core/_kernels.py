@@ -0,0 +1,34 @@
+# src/aers/core/_kernels.py
+
+"""
+Numeric kernels shared by the routing engine and DSP nodes.
+
+Kernels write into caller-provided float32 arrays so the per-block hot path
+does not allocate temporaries.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+def mix_inputs(out: np.ndarray, inputs: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Sum equally shaped (frames, channels) blocks into `out`.
+
+    `out` is overwritten. Each input is read once through an in-place ufunc
+    add, so mixing N inputs costs N - 1 passes and no intermediate arrays.
+    """
+    if not inputs:
+        out.fill(0.0)
+        return out
+    if len(inputs) == 1:
+        np.copyto(out, inputs[0])
+        return out
+    # The first two inputs are summed straight into `out` in one pass.
+    np.add(inputs[0], inputs[1], out=out)
+    for x in inputs[2:]:
+        np.add(out, x, out=out)
+    return out
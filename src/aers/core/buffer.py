@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 
 @dataclass(slots=True)
@@ -12,9 +13,9 @@ class AudioBuffer:
     def num_frames(self) -> int:
         return int(self.samples.shape[0])
 
-    @ property
+    @property
     def num_channels(self) -> int:
-        return int(self.samples.shape[0])
+        return int(self.samples.shape[1])
     
     def copy(self) -> "AudioBuffer":
         return AudioBuffer(
@@ -24,9 +25,23 @@ class AudioBuffer:
         )
     
     @staticmethod
-    def silence(num_frames: int, num_channels: int, sample_rate: int, t0: int) -> "AudioBuffer":
+    def silence(
+        num_frames: int,
+        num_channels: int,
+        sample_rate: int,
+        t0: int,
+        out: Optional[np.ndarray] = None,
+    ) -> "AudioBuffer":
+        "Silent buffer; zero-fills `out` in place when a preallocated array is given"
+        if out is None:
+            samples = np.zeros((num_frames, num_channels), dtype=np.float32)
+        else:
+            if out.shape != (num_frames, num_channels):
+                raise ValueError(f"out must have shape {(num_frames, num_channels)}, got {out.shape}")
+            out.fill(0.0)
+            samples = out
         return AudioBuffer(
-            samples=np.zeros((num_frames, num_channels), dtype=np.float32),
+            samples=samples,
             sample_rate=sample_rate,
             t0=t0
         )
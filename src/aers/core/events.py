@@ -6,7 +6,7 @@ from typing import Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioFrame:
     """
     A block of audio samples with an associated start timestamp.
@@ -14,6 +14,10 @@ class AudioFrame:
     data: np.ndarray of shape (num_frames, num_channels), dtype=float32
     sample_rate: samples per second (e.g. 48000)
     timestamp: start time of this frame in seconds
+
+    Samples are interleaved (one row per frame) and nodes keep that layout
+    internally as well: time ranges are contiguous row slices, and scipy
+    filters already copy into their own planar work buffers.
     """
     data: np.ndarray
     sample_rate: int
@@ -25,6 +29,20 @@ class AudioFrame:
         if self.data.dtype != np.float32:
             self.data = self.data.astype(np.float32, copy=False)
 
+    @classmethod
+    def unchecked(cls, data: np.ndarray, sample_rate: int, timestamp: float) -> "AudioFrame":
+        """
+        Build a frame without the shape/dtype checks in __post_init__.
+
+        For hot paths that already produce 2D float32 blocks (node outputs);
+        user-facing code should use the validating constructor.
+        """
+        frame = object.__new__(cls)
+        frame.data = data
+        frame.sample_rate = sample_rate
+        frame.timestamp = timestamp
+        return frame
+
     @property
     def num_frames(self) -> int:
         return int(self.data.shape[0])
@@ -35,9 +53,16 @@ class AudioFrame:
 
     @property
     def peak(self) -> float:
+        """
+        Largest absolute sample value.
+
+        Recomputed on every access rather than cached: node outputs live in
+        pooled buffers that are overwritten OUTPUT_POOL_SLOTS blocks later.
+        """
         if self.data.size == 0:
             return 0.0
-        return float(np.max(np.abs(self.data)))
+        # max(|x|) as two reductions; avoids materializing an abs() copy.
+        return float(max(-self.data.min(), self.data.max()))
 
 
 @dataclass(frozen=True)
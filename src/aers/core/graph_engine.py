@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Iterable, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple, Iterable, Optional, Set, cast
 
 import numpy as np
 
 from .events import AudioFrame
-from .nodes import BaseNode
-from aers.modules import create_node_instance
+from .nodes import BaseNode, OUTPUT_POOL_SLOTS
+from aers.modules import NODE_TYPE_REGISTRY, create_node_instance
 
 
 @dataclass(frozen=True)
@@ -18,6 +20,54 @@ class Connection:
     dst: str
 
 
+@dataclass(frozen=True, slots=True)
+class NodeSpec:
+    """
+    Canonical, read-only description of one node in a routing config.
+
+    Built once from the config mapping (see from_dict), so consumers use
+    attribute access instead of repeated dict lookups.
+    """
+
+    id: str
+    kind: str = "passthrough"
+    params: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    position: Optional[Tuple[float, float]] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "NodeSpec":
+        """Validate a config node mapping (id, kind, params, position)."""
+        try:
+            node_id = data["id"]
+        except KeyError as e:
+            raise ValueError(f"Node entry missing key: {e}") from e
+
+        params = data.get("params") or {}
+        if not isinstance(params, Mapping):
+            raise TypeError(f"Node '{node_id}' params must be a mapping")
+
+        position = None
+        pos = data.get("position")
+        if isinstance(pos, Mapping):
+            position = (float(pos.get("x", 0)), float(pos.get("y", 0)))
+        elif isinstance(pos, (list, tuple)) and len(pos) >= 2:
+            position = (float(pos[0]), float(pos[1]))
+
+        return cls(
+            id=str(node_id),
+            kind=str(data.get("kind", "passthrough")),
+            params=MappingProxyType(dict(params)),
+            position=position,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain mapping in config layout, suitable for YAML dumping."""
+        data: Dict[str, Any] = {"id": self.id, "kind": self.kind, "params": dict(self.params)}
+        if self.position is not None:
+            data["position"] = {"x": self.position[0], "y": self.position[1]}
+        return data
+
+
 class GraphEngine:
     """
     Core audio routing engine.
@@ -32,32 +82,54 @@ class GraphEngine:
         self,
         sample_rate: int,
         frame_size: int,
-        node_specs: List[dict],
-        connections: List[Connection],
+        node_specs: Iterable[NodeSpec | Mapping[str, Any]],
+        connections: Iterable[Connection],
         default_channels: int = 2,
         node_positions: Optional[Dict[str, Tuple[float, float]]] = None,
     ) -> None:
         self.sample_rate = int(sample_rate)
         self.frame_size = int(frame_size)
         self.default_channels = int(default_channels)
+        self._seconds_per_frame: float = self.frame_size / float(self.sample_rate)
 
         self._nodes: Dict[str, BaseNode] = {}
-        self._connections: List[Connection] = connections
+        self._nodes_view: Mapping[str, BaseNode] = MappingProxyType(self._nodes)
+        self._connections: Tuple[Connection, ...] = tuple(connections)
         self._node_positions: Dict[str, Tuple[float, float]] = node_positions or {}
         self._layout_version: int = 0
+        # Reverse registry lookup (node class -> kind) for graph state payloads.
+        self._kind_map: Dict[type, str] = {cls: kind for kind, cls in NODE_TYPE_REGISTRY.items()}
 
         self._build_nodes(node_specs)
+        self._buffer_pool: Dict[str, np.ndarray] = {}
+        self._allocate_buffers()
         self._validate()
-        self._execution_order: List[str] = self._topological_sort()
+        self._execution_order: Tuple[str, ...] = tuple(self._topological_sort())
+        # Connections are fixed for the lifetime of the engine, so the
+        # per-node input lists are built once rather than on every block.
+        self._inputs_map: Dict[str, Tuple[str, ...]] = self._build_input_map()
+        self._plan: List[Tuple[BaseNode, int, Tuple[int, ...]]] = self._build_plan()
+        # Nodes and connections are immutable after construction; only the
+        # positions change, so the static part of the graph state is built once.
+        self._nodes_state_tpl: List[Dict[str, str]] = [
+            {"id": node_id, "name": node.name, "kind": self._kind_map.get(type(node), "unknown")}
+            for node_id, node in self._nodes.items()
+        ]
+        self._connections_state: List[Dict[str, str]] = [
+            {"from": conn.src, "to": conn.dst} for conn in self._connections
+        ]
+        self._graph_state_cache: Optional[Tuple[int, Dict[str, Any]]] = None
 
     # --------------------------------------------------------------------- #
     # Graph building
     # --------------------------------------------------------------------- #
-    def _build_nodes(self, node_specs: List[dict]) -> None:
+    def _build_nodes(self, node_specs: Iterable[NodeSpec | Mapping[str, Any]]) -> None:
         for spec in node_specs:
-            node_id = spec["id"]
-            kind = spec.get("kind", "passthrough")
-            config = dict(spec.get("params", {}))
+            if not isinstance(spec, NodeSpec):
+                spec = NodeSpec.from_dict(spec)
+            node_id = spec.id
+            kind = spec.kind
+            config = dict(spec.params)
             channels = int(config.pop("channels", self.default_channels))
 
             if node_id in self._nodes:
@@ -72,6 +144,16 @@ class GraphEngine:
             )
             self._nodes[node_id] = node
 
+    def _allocate_buffers(self) -> None:
+        """
+        Preallocate each node's output buffers so the frame loop does not
+        allocate a fresh array per node per block.
+        """
+        for node_id, node in self._nodes.items():
+            pool = np.zeros((OUTPUT_POOL_SLOTS, self.frame_size, node.channels), dtype=np.float32)
+            self._buffer_pool[node_id] = pool
+            node.bind_output_pool(pool)
+
     def _validate(self) -> None:
         # Ensure all connection endpoints exist
         ids: Set[str] = set(self._nodes.keys())
@@ -91,7 +173,7 @@ class GraphEngine:
             incoming_count[c.dst] += 1
 
         # Start with nodes that have no incoming edges
-        queue: List[str] = [nid for nid, cnt in incoming_count.items() if cnt == 0]
+        queue: deque[str] = deque(nid for nid, cnt in incoming_count.items() if cnt == 0)
         order: List[str] = []
 
         outgoing: Dict[str, List[str]] = {nid: [] for nid in self._nodes.keys()}
@@ -99,7 +181,7 @@ class GraphEngine:
             outgoing[c.src].append(c.dst)
 
         while queue:
-            nid = queue.pop(0)
+            nid = queue.popleft()
             order.append(nid)
             for dst in outgoing[nid]:
                 incoming_count[dst] -= 1
@@ -114,42 +196,66 @@ class GraphEngine:
     # --------------------------------------------------------------------- #
     # Processing
     # --------------------------------------------------------------------- #
-    def _build_input_map(self) -> Dict[str, List[str]]:
+    def _build_input_map(self) -> Dict[str, Tuple[str, ...]]:
         inputs: Dict[str, List[str]] = {nid: [] for nid in self._nodes.keys()}
         for c in self._connections:
             inputs[c.dst].append(c.src)
-        return inputs
+        return {nid: tuple(srcs) for nid, srcs in inputs.items()}
+
+    def _build_plan(self) -> List[Tuple[BaseNode, int, Tuple[int, ...]]]:
+        """
+        Flatten the graph into (node, output_slot, input_slots) steps.
+
+        Slots index into a per-frame output list laid out in execution order,
+        so the frame loop only does list indexing instead of dict lookups.
+        """
+        slots = {nid: i for i, nid in enumerate(self._execution_order)}
+        return [
+            (
+                self._nodes[nid],
+                slots[nid],
+                tuple(slots[src] for src in self._inputs_map[nid]),
+            )
+            for nid in self._execution_order
+        ]
 
     def process_frame(self, frame_index: int) -> Dict[str, AudioFrame]:
         """
         Process a single block of audio and return frames for all nodes.
 
+        Frame data may live in the engine's buffer pool and is only guaranteed
+        until the next call; copy it if it must outlive the following block.
+
         Returns:
             Dict mapping node_id -> AudioFrame for this block.
         """
-        inputs_map = self._build_input_map()
-        outputs: Dict[str, AudioFrame] = {}
+        return self._process_block(self.frame_size, frame_index * self._seconds_per_frame)
 
-        # Calculate timestamp for this frame
-        timestamp = float(frame_index * self.frame_size) / float(self.sample_rate)
+    def _process_block(self, num_frames: int, timestamp: float) -> Dict[str, AudioFrame]:
+        """Run every node once over a block of `num_frames` samples."""
+        # Bind loop invariants to locals to keep attribute lookups out of the loop.
+        plan = self._plan
+        # Placeholders only: the plan is in topological order, so every slot
+        # is filled before any node reads it as an input.
+        outputs = cast(List[AudioFrame], [None] * len(plan))
 
-        for node_id in self._execution_order:
-            node = self._nodes[node_id]
-            input_ids = inputs_map[node_id]
+        for node, slot, input_slots in plan:
             input_frames: Optional[Iterable[AudioFrame]] = None
 
-            if input_ids:
+            if len(input_slots) == 1:
+                # Single-input chains are the common case; skip the list build.
+                input_frames = (outputs[input_slots[0]],)
+            elif input_slots:
                 # Collect all input frames
-                input_frames = [outputs[i] for i in input_ids]
+                input_frames = [outputs[i] for i in input_slots]
 
-            frame = node.process(
-                num_frames=self.frame_size,
+            outputs[slot] = node.process(
+                num_frames=num_frames,
                 timestamp=timestamp,
                 inputs=input_frames,
             )
-            outputs[node_id] = frame
 
-        return outputs
+        return dict(zip(self._execution_order, outputs))
 
     def run(
         self,
@@ -171,20 +277,72 @@ class GraphEngine:
 
         return last_frames
 
+    def run_batched(
+        self,
+        num_frames: int,
+        block_multiplier: int = 16,
+        track_nodes: Optional[Iterable[str]] = None,
+    ) -> Dict[str, AudioFrame]:
+        """
+        Offline equivalent of `run` that processes `block_multiplier` frames
+        per node call, amortizing per-block Python overhead.
+
+        Returns the same final `frame_size` block per node as `run`. Falls back
+        to `run` when any node's output depends on the block size.
+        """
+        if block_multiplier <= 1 or not all(
+            node.supports_variable_block_size for node in self._nodes.values()
+        ):
+            return self.run(num_frames, track_nodes=track_nodes)
+
+        tracked = set(track_nodes) if track_nodes is not None else None
+        last_frames: Dict[str, AudioFrame] = {}
+
+        num_batches, remainder = divmod(num_frames, block_multiplier)
+        batch_size = self.frame_size * block_multiplier
+        frames: Dict[str, AudioFrame] = {}
+
+        for batch_idx in range(num_batches):
+            timestamp = batch_idx * block_multiplier * self._seconds_per_frame
+            frames = self._process_block(batch_size, timestamp)
+
+        if not remainder and frames:
+            # Report only the trailing frame_size samples, as `run` would.
+            tail_offset = (block_multiplier - 1) * self.frame_size
+            last_timestamp = (num_frames - 1) * self._seconds_per_frame
+            frames = {
+                nid: AudioFrame.unchecked(
+                    data=frame.data[tail_offset:],
+                    sample_rate=frame.sample_rate,
+                    timestamp=last_timestamp,
+                )
+                for nid, frame in frames.items()
+            }
+
+        for frame_idx in range(num_batches * block_multiplier, num_frames):
+            frames = self.process_frame(frame_idx)
+
+        for nid, frame in frames.items():
+            if tracked is None or nid in tracked:
+                last_frames[nid] = frame
+
+        return last_frames
+
     # --------------------------------------------------------------------- #
     # Introspection helpers
     # --------------------------------------------------------------------- #
     @property
-    def nodes(self) -> Dict[str, BaseNode]:
-        return dict(self._nodes)
+    def nodes(self) -> Mapping[str, BaseNode]:
+        """Read-only view of the nodes by id."""
+        return self._nodes_view
 
     @property
-    def connections(self) -> List[Connection]:
-        return list(self._connections)
+    def connections(self) -> Tuple[Connection, ...]:
+        return self._connections
 
     @property
-    def execution_order(self) -> List[str]:
-        return list(self._execution_order)
+    def execution_order(self) -> Tuple[str, ...]:
+        return self._execution_order
     
     def set_node_position(self, node_id: str, x: float, y: float) -> None:
         """Update node position in layout."""
@@ -197,45 +355,30 @@ class GraphEngine:
         """Get node position, defaulting to (0, 0) if not set."""
         return self._node_positions.get(node_id, (0.0, 0.0))
     
-    def get_graph_state(self) -> Dict[str, any]:
-        """Get complete graph state including layout for visualization."""
-        from aers.modules import NODE_TYPE_REGISTRY
-        
-        # Map node classes to kind names
-        kind_map = {}
-        for k, v in NODE_TYPE_REGISTRY.items():
-            kind_map[v] = k
-        
+    def get_graph_state(self) -> Dict[str, Any]:
+        """
+        Get complete graph state including layout for visualization.
+
+        The payload is cached per layout version, so repeated polls between
+        layout edits do not rebuild it. Each call returns a fresh top-level
+        dict and lists, so callers may add keys or entries; the per-node and
+        per-connection dicts inside are shared and must not be mutated.
+        """
+        cached = self._graph_state_cache
+        if cached is None or cached[0] != self._layout_version:
+            cached = self._graph_state_cache = (self._layout_version, self._build_graph_state())
+        state = cached[1]
+        return {**state, "nodes": list(state["nodes"]), "connections": list(state["connections"])}
+
+    def _build_graph_state(self) -> Dict[str, Any]:
+        """Graph state for the current layout version (see get_graph_state)."""
         nodes = []
-        for node_id, node in self._nodes.items():
-            node_type = type(node)
-            kind = "unknown"
-            
-            # Check if node type is in registry
-            if node_type in kind_map:
-                kind = kind_map[node_type]
-            else:
-                # Try to match by class name
-                for cls, k in kind_map.items():
-                    if node_type == cls:
-                        kind = k
-                        break
-            
-            pos = self.get_node_position(node_id)
-            nodes.append({
-                "id": node_id,
-                "name": node.name,
-                "kind": kind,
-                "position": {"x": pos[0], "y": pos[1]},
-            })
-        
-        connections = [
-            {"from": conn.src, "to": conn.dst}
-            for conn in self._connections
-        ]
+        for tpl in self._nodes_state_tpl:
+            pos = self.get_node_position(tpl["id"])
+            nodes.append({**tpl, "position": {"x": pos[0], "y": pos[1]}})
         
         return {
             "nodes": nodes,
-            "connections": connections,
+            "connections": self._connections_state,
             "layout_version": self._layout_version,
         }
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import math
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 import numpy as np
 
+from ._kernels import mix_inputs
 from .events import AudioFrame
 
 
+# Number of output buffers each node cycles through when bound to a pool.
+# A frame returned by `process` stays valid until this many further blocks
+# have been produced by the same node.
+OUTPUT_POOL_SLOTS = 2
+
+_TWO_PI = 2.0 * math.pi
+
+
 class BaseNode(ABC):
     """
     Base class for all processing nodes in the routing graph.
@@ -19,6 +31,11 @@ class BaseNode(ABC):
     a single AudioFrame output with the same sample rate and channel count.
     """
 
+    # Whether the node produces the same signal regardless of how the stream
+    # is split into blocks. GraphEngine.run_batched only batches graphs whose
+    # nodes all support this.
+    supports_variable_block_size: bool = True
+
     def __init__(
         self,
         name: str,
@@ -30,6 +47,59 @@ class BaseNode(ABC):
         self.sample_rate = int(sample_rate)
         self.channels = int(channels)
         self.config = config or {}
+        self._out_pool: Optional[np.ndarray] = None
+        self._out_slot: int = 0
+        self._scratch: Optional[np.ndarray] = None
+        self._silence_buf: Optional[np.ndarray] = None
+
+    def bind_output_pool(self, pool: np.ndarray) -> None:
+        """
+        Attach a preallocated (slots, num_frames, channels) float32 pool.
+
+        Once bound, `_next_output` hands out the pool's slots round-robin
+        instead of allocating a fresh array for every block.
+        """
+        if pool.ndim != 3 or pool.shape[2] != self.channels:
+            raise ValueError(
+                f"Output pool for '{self.name}' must have shape (slots, frames, {self.channels}), "
+                f"got {pool.shape}"
+            )
+        self._out_pool = pool
+        self._out_slot = 0
+
+    def _next_output(self, num_frames: int) -> np.ndarray:
+        """
+        Return a writable (num_frames, channels) float32 buffer for this block.
+
+        Contents are undefined; callers must overwrite every sample. Falls back
+        to a fresh allocation when no pool is bound or the block size differs.
+        """
+        pool = self._out_pool
+        if pool is None or pool.shape[1] != num_frames:
+            return np.empty((num_frames, self.channels), dtype=np.float32)
+        self._out_slot = (self._out_slot + 1) % pool.shape[0]
+        return pool[self._out_slot]
+
+    def _get_scratch(self, num_frames: int) -> np.ndarray:
+        """
+        Return a reusable (num_frames, channels) float32 work buffer.
+
+        The buffer is private to the node and overwritten on the next call,
+        so it must never be returned as a node's output.
+        """
+        buf = self._scratch
+        if buf is None or buf.shape[0] != num_frames:
+            buf = self._scratch = np.empty((num_frames, self.channels), dtype=np.float32)
+        return buf
+
+    def _silence(self, num_frames: int) -> np.ndarray:
+        """Return a shared, read-only block of zeros."""
+        buf = self._silence_buf
+        if buf is None or buf.shape[0] != num_frames:
+            buf = np.zeros((num_frames, self.channels), dtype=np.float32)
+            buf.flags.writeable = False
+            self._silence_buf = buf
+        return buf
 
     @abstractmethod
     def process(
@@ -76,6 +146,20 @@ class SineSourceNode(BaseNode):
         self.frequency_hz: float = float(cfg.get("frequency_hz", 440.0))
         self.amplitude: float = float(cfg.get("amplitude", 0.2))
         self._phase: float = float(cfg.get("initial_phase", 0.0))
+        # Per-sample phase ramp and per-block phase advance, cached per
+        # (num_frames, frequency_hz); rebuilt for the first real block size.
+        self._ramp_key: Tuple[int, float] = (0, self.frequency_hz)
+        self._ramp: np.ndarray = np.empty(0, dtype=np.float32)
+        self._block_advance: float = 0.0
+        self._phase_scratch: np.ndarray = np.empty(0, dtype=np.float32)
+
+    def _update_ramp(self, num_frames: int) -> None:
+        """Rebuild the cached phase ramp for a block of `num_frames`."""
+        phase_increment = _TWO_PI * self.frequency_hz / float(self.sample_rate)
+        self._ramp = phase_increment * np.arange(num_frames, dtype=np.float32)
+        self._block_advance = phase_increment * num_frames
+        self._phase_scratch = np.empty(num_frames, dtype=np.float32)
+        self._ramp_key = (num_frames, self.frequency_hz)
 
     def process(
         self,
@@ -84,19 +168,21 @@ class SineSourceNode(BaseNode):
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
         # Ignore inputs; this is a pure source.
-        t = (np.arange(num_frames, dtype=np.float32) + self._phase) / float(self.sample_rate)
-        phase_increment = 2.0 * np.pi * self.frequency_hz / float(self.sample_rate)
+        if self._ramp_key != (num_frames, self.frequency_hz):
+            self._update_ramp(num_frames)
 
         # Compute phase per-sample to keep continuity
-        phases = self._phase + phase_increment * np.arange(num_frames, dtype=np.float32)
-        wave = self.amplitude * np.sin(phases, dtype=np.float32)
+        wave = np.add(self._ramp, self._phase, out=self._phase_scratch)
+        np.sin(wave, out=wave)
+        wave *= self.amplitude
 
         # Update internal phase (wrap to avoid float blow-up)
-        self._phase = float((self._phase + phase_increment * num_frames) % (2.0 * np.pi))
+        self._phase = (self._phase + self._block_advance) % _TWO_PI
 
         # Broadcast to channels
-        data = np.repeat(wave[:, None], self.channels, axis=1).astype(np.float32, copy=False)
-        return AudioFrame(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+        data = self._next_output(num_frames)
+        data[:] = wave[:, None]
+        return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
 
 
 class AudioFileSourceNode(BaseNode):
@@ -133,80 +219,188 @@ class AudioFileSourceNode(BaseNode):
         # Load audio file
         try:
             import soundfile as sf
-            self._audio_data, self._file_sr = sf.read(str(self.file_path), dtype='float32')
-            
-            # Convert to mono if needed, then to target channels
-            if self._audio_data.ndim == 1:
-                self._audio_data = self._audio_data[:, None]
-            
-            # Resample if needed (simple linear interpolation for now)
-            if self._file_sr != self.sample_rate:
+            # Exactly one of these holds the audio: the open file when
+            # streaming from disk, or the decoded samples in memory.
+            self._sf: Any = None
+            self._audio_data: Optional[np.ndarray] = None
+            # Set when _audio_data holds int16 PCM rather than float32 samples.
+            self._audio_scale: Optional[float] = None
+            sound_file = sf.SoundFile(str(self.file_path))
+            self._file_sr = sound_file.samplerate
+            self._file_channels = sound_file.channels
+
+            if self._file_sr == self.sample_rate:
+                # No resampling needed: read blocks from disk on demand so
+                # memory use does not grow with the length of the file.
+                self._sf = sound_file
+                self._num_samples = sound_file.frames
+            else:
+                with sound_file:
+                    pcm16 = sound_file.subtype == 'PCM_16'
+                    audio = sound_file.read(dtype='float32', always_2d=True)
+
+                # Drop surplus channels before resampling so they are never filtered.
+                if audio.shape[1] > self.channels:
+                    audio = audio[:, :self.channels]
+
+                # Resample with a polyphase FIR (rates are integers, so the
+                # up/down ratio is exact).
+                from math import gcd
                 from scipy import signal
-                num_samples = int(len(self._audio_data) * self.sample_rate / self._file_sr)
-                self._audio_data = signal.resample(self._audio_data, num_samples, axis=0).astype(np.float32)
-            
-            # Match channel count
-            if self._audio_data.shape[1] != self.channels:
-                if self._audio_data.shape[1] == 1 and self.channels > 1:
-                    self._audio_data = np.repeat(self._audio_data, self.channels, axis=1)
+                g = gcd(int(self._file_sr), self.sample_rate)
+                up = self.sample_rate // g
+                down = int(self._file_sr) // g
+                audio = signal.resample_poly(audio, up, down, axis=0, window=("kaiser", 5.0))
+
+                audio = self._match_channels(audio)
+                # Resampling can overshoot full scale (Gibbs ringing on
+                # sharp edges); such signals stay float32 rather than being
+                # clipped to the int16 range.
+                fits_int16 = audio.size == 0 or max(-audio.min(), audio.max()) * 32768.0 <= 32767.0
+                if pcm16 and fits_int16:
+                    # 16-bit sources stay 16-bit in memory (half the bytes of
+                    # float32) and are converted one block at a time.
+                    self._audio_scale = 1.0 / 32768.0
+                    self._audio_data = np.rint(audio * 32768.0).astype(np.int16)
                 else:
-                    self._audio_data = self._audio_data[:, :self.channels]
-            
-            self._audio_data = self._audio_data.astype(np.float32)
+                    self._audio_data = np.ascontiguousarray(audio, dtype=np.float32)
+                self._num_samples = len(self._audio_data)
+
             self._position = int(self.start_offset * self.sample_rate)
             
             # Compute overall file statistics
-            self._file_duration = len(self._audio_data) / float(self.sample_rate)
-            self._file_peak = float(np.max(np.abs(self._audio_data)))
-            self._file_rms = float(np.sqrt(np.mean(self._audio_data.astype(np.float64) ** 2)))
+            self._file_duration = self._num_samples / float(self.sample_rate)
+            self._file_peak, self._file_rms = self._file_stats()
             
             # Generate waveform data for visualization (downsampled to ~1000 points)
             self._waveform_points = self._generate_waveform(max_points=1000)
+
+            # Metadata that never changes after loading; get_file_info adds
+            # the playback position on top.
+            self._static_file_info = {
+                "file_path": str(self.file_path),
+                "duration": self._file_duration,
+                "file_peak": self._file_peak,
+                "file_rms": self._file_rms,
+                "total_samples": self._num_samples,
+                "loop": self.loop,
+                "waveform": self._waveform_points,
+            }
             
         except ImportError:
             raise ImportError("soundfile is required for AudioFileSourceNode. Install with: pip install soundfile")
         except Exception as e:
             raise RuntimeError(f"Failed to load audio file {self.file_path}: {e}") from e
-    
+
+    def __del__(self):
+        """Close the streamed audio file."""
+        if getattr(self, "_sf", None) is not None:
+            try:
+                self._sf.close()
+            except Exception:
+                pass
+
+    def _match_channels(self, audio: np.ndarray) -> np.ndarray:
+        """Up-mix mono or drop surplus channels to match `self.channels`."""
+        if audio.shape[1] == self.channels:
+            return audio
+        if audio.shape[1] == 1 and self.channels > 1:
+            return np.repeat(audio, self.channels, axis=1)
+        return audio[:, :self.channels]
+
+    def _decode(self, block: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convert stored samples to float32, into `out` when given."""
+        if self._audio_scale is None:
+            if out is None:
+                return block
+            out[:] = block
+            return out
+        return np.multiply(block, self._audio_scale, out=out, dtype=np.float32)
+
+    def _iter_chunks(self, chunk_frames: int) -> Iterator[np.ndarray]:
+        """Yield the whole file in order as channel-matched chunks."""
+        audio = self._audio_data
+        if audio is not None:
+            for start in range(0, self._num_samples, chunk_frames):
+                yield self._decode(audio[start:start + chunk_frames])
+            return
+        self._sf.seek(0)
+        for block in self._sf.blocks(blocksize=chunk_frames, dtype='float32', always_2d=True):
+            yield self._match_channels(block)
+
+    def _read_into(self, out: np.ndarray, start: int) -> None:
+        """Fill `out` with the samples starting at frame `start`."""
+        audio = self._audio_data
+        if audio is not None:
+            self._decode(audio[start:start + len(out)], out=out)
+            return
+        self._sf.seek(start)
+        if self._file_channels == self.channels:
+            self._sf.read(dtype='float32', always_2d=True, out=out)
+        else:
+            block = self._sf.read(len(out), dtype='float32', always_2d=True)
+            out[:] = self._match_channels(block)
+
+    def _file_stats(self, chunk_frames: int = 65_536) -> tuple:
+        """
+        Return (peak, rms) of the audio in one chunked pass.
+
+        Sum of squares is accumulated per chunk in float64, so neither an abs
+        temporary nor a float64 copy of the whole file is materialized.
+        """
+        if self._num_samples == 0:
+            return 0.0, 0.0
+        peak = 0.0
+        sumsq = 0.0
+        for chunk in self._iter_chunks(chunk_frames):
+            chunk = chunk.ravel()
+            peak = max(peak, -float(chunk.min()), float(chunk.max()))
+            sumsq += float(np.dot(chunk, chunk))
+        return peak, float(np.sqrt(sumsq / (self._num_samples * self.channels)))
+
     def _generate_waveform(self, max_points: int = 1000) -> list:
         """Generate downsampled waveform data for visualization."""
-        total_samples = len(self._audio_data)
+        total_samples = self._num_samples
         if total_samples == 0:
             return []
         
         # Downsample to max_points for efficient rendering
         step = max(1, total_samples // max_points)
-        num_points = total_samples // step
-        
-        # Compute min/max for each segment (creates a classic waveform look)
-        waveform = []
-        for i in range(num_points):
-            start_idx = i * step
-            end_idx = min((i + 1) * step, total_samples)
-            segment = self._audio_data[start_idx:end_idx]
-            
-            # Get min and max for this segment (creates the waveform envelope)
-            min_val = float(np.min(segment))
-            max_val = float(np.max(segment))
-            waveform.append({"min": min_val, "max": max_val, "time": start_idx / float(self.sample_rate)})
-        
-        return waveform
+
+        # Min/max over each segment and all channels (classic waveform look).
+        # Chunks are a whole number of segments, so each one is reduced in a
+        # single pass over a (points, step, channels) view.
+        min_parts: List[np.ndarray] = []
+        max_parts: List[np.ndarray] = []
+        for chunk in self._iter_chunks(max(1, 65_536 // step) * step):
+            num_points = len(chunk) // step
+            if num_points:
+                blocks = chunk[: num_points * step].reshape(num_points, step, -1)
+                min_parts.append(blocks.min(axis=(1, 2)))
+                max_parts.append(blocks.max(axis=(1, 2)))
+            # Trailing partial segment (only ever in the last chunk).
+            if num_points * step < len(chunk):
+                tail = chunk[num_points * step:]
+                min_parts.append(np.array([tail.min()]))
+                max_parts.append(np.array([tail.max()]))
+
+        mins = np.concatenate(min_parts)
+        maxs = np.concatenate(max_parts)
+        times = np.arange(len(mins)) * (step / float(self.sample_rate))
+        # The dashboard consumes a list of {min, max, time} points.
+        return [
+            {"min": lo, "max": hi, "time": t}
+            for lo, hi, t in zip(mins.tolist(), maxs.tolist(), times.tolist())
+        ]
     
     def get_file_info(self) -> Dict[str, Any]:
         """Get metadata about the loaded audio file."""
         current_time = self._position / float(self.sample_rate)
-        progress = (self._position / len(self._audio_data) * 100.0) if len(self._audio_data) > 0 else 0.0
-        return {
-            "file_path": str(self.file_path),
-            "duration": self._file_duration,
-            "current_time": current_time,
-            "progress_percent": progress,
-            "file_peak": self._file_peak,
-            "file_rms": self._file_rms,
-            "total_samples": len(self._audio_data),
-            "loop": self.loop,
-            "waveform": self._waveform_points,
-        }
+        progress = (self._position / self._num_samples * 100.0) if self._num_samples > 0 else 0.0
+        info = self._static_file_info.copy()
+        info["current_time"] = current_time
+        info["progress_percent"] = progress
+        return info
 
     def process(
         self,
@@ -214,34 +408,85 @@ class AudioFileSourceNode(BaseNode):
         timestamp: float,
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
-        if self._position >= len(self._audio_data):
+        total_samples = self._num_samples
+        audio = self._audio_data  # None when streaming from disk
+        if self._position >= total_samples:
             if self.loop:
                 self._position = 0
             else:
                 # End of file, return silence
-                data = np.zeros((num_frames, self.channels), dtype=np.float32)
-                return AudioFrame(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+                data = self._silence(num_frames)
+                return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
         
         end_pos = self._position + num_frames
-        if end_pos > len(self._audio_data):
+        if end_pos > total_samples:
+            available = total_samples - self._position
+            data = self._next_output(num_frames)
+            self._read_into(data[:available], self._position)
             if self.loop:
                 # Wrap around
-                chunk1 = self._audio_data[self._position:]
-                remaining = num_frames - len(chunk1)
-                chunk2 = self._audio_data[:remaining]
-                data = np.vstack([chunk1, chunk2]).astype(np.float32)
+                remaining = num_frames - available
+                self._read_into(data[available:], 0)
                 self._position = remaining
             else:
                 # Pad with zeros
-                chunk = self._audio_data[self._position:]
-                pad = np.zeros((num_frames - len(chunk), self.channels), dtype=np.float32)
-                data = np.vstack([chunk, pad]).astype(np.float32)
-                self._position = len(self._audio_data)
+                data[available:] = 0.0
+                self._position = total_samples
+        elif audio is not None and self._audio_scale is None:
+            # In-memory float32: hand out a view, no copy
+            data = audio[self._position:end_pos]
+            self._position = end_pos
         else:
-            data = self._audio_data[self._position:end_pos].astype(np.float32, copy=False)
+            data = self._next_output(num_frames)
+            self._read_into(data, self._position)
             self._position = end_pos
         
-        return AudioFrame(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+        return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+
+
+def _mix_inputs(
+    num_frames: int,
+    channels: int,
+    inputs: Iterable[AudioFrame],
+    *,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Sum `inputs` into a (num_frames, channels) float32 block.
+
+    Inputs with a different channel count are up-mixed (mono) or truncated,
+    and inputs of the wrong length are zero-padded or truncated. The result
+    is written into `out` when given, otherwise into a fresh array; it never
+    aliases one of the inputs. No inputs yields silence.
+    """
+    if out is None:
+        out = np.empty((num_frames, channels), dtype=np.float32)
+    if not isinstance(inputs, (list, tuple)):
+        inputs = list(inputs)
+    if not inputs:
+        out.fill(0.0)
+        return out
+
+    # Common multi-input case: every input already matches our block shape.
+    expected_shape = (num_frames, channels)
+    if all(f.data.shape == expected_shape for f in inputs):
+        mix_inputs(out, [f.data for f in inputs])
+        return out
+
+    # Accumulate each input's overlap with the block in place; missing
+    # samples simply stay zero, so nothing is padded or copied.
+    out.fill(0.0)
+    for frame in inputs:
+        buf = frame.data[:num_frames]
+        k = len(buf)
+        if buf.shape[1] == 1:
+            # Mono broadcasts across every output channel.
+            out[:k] += buf
+        else:
+            c = min(buf.shape[1], channels)
+            out[:k, :c] += buf[:, :c]
+
+    return out
 
 
 class PassthroughNode(BaseNode):
@@ -256,30 +501,14 @@ class PassthroughNode(BaseNode):
         timestamp: float,
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
-        if not inputs:
-            data = np.zeros((num_frames, self.channels), dtype=np.float32)
-            return AudioFrame(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
-
-        inputs = list(inputs)
-        # Ensure all inputs are the right length; truncate or pad with zeros if needed.
-        mixed = np.zeros((num_frames, self.channels), dtype=np.float32)
-        for frame in inputs:
-            buf = frame.data
-            # Up/down mix channels if necessary
-            if frame.num_channels != self.channels:
-                if frame.num_channels == 1 and self.channels > 1:
-                    buf = np.repeat(buf, self.channels, axis=1)
-                else:
-                    buf = buf[:, : self.channels]
-            # Match length
-            if frame.num_frames < num_frames:
-                pad = np.zeros((num_frames - frame.num_frames, self.channels), dtype=np.float32)
-                buf = np.vstack([buf, pad])
-            elif frame.num_frames > num_frames:
-                buf = buf[:num_frames, :]
-            mixed += buf.astype(np.float32, copy=False)
-
-        return AudioFrame(data=mixed, sample_rate=self.sample_rate, timestamp=timestamp)
+        if isinstance(inputs, (list, tuple)) and len(inputs) == 1:
+            data = inputs[0].data
+            if data.shape == (num_frames, self.channels):
+                # Nothing to mix: pass the upstream block through as a view.
+                # Nodes never write to their inputs, so sharing it is safe.
+                return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+        data = _mix_inputs(num_frames, self.channels, inputs or (), out=self._next_output(num_frames))
+        return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
 
 
 # ---------------------------------------------------------------------------
@@ -303,8 +532,12 @@ class GainNode(BaseNode):
         config: Optional[Dict[str, Any]] = None,
     ) -> None:
         super().__init__(name, sample_rate, channels, config)
-        gain_db = float(self.config.get("gain_db", 0.0))
-        self._gain_linear: float = float(10.0 ** (gain_db / 20.0))
+        self._gain_linear: float = 1.0
+        self.set_gain_db(float(self.config.get("gain_db", 0.0)))
+
+    def set_gain_db(self, gain_db: float) -> None:
+        """Change the gain; takes effect from the next block."""
+        self._gain_linear = math.pow(10.0, gain_db / 20.0)
 
     def process(
         self,
@@ -312,20 +545,56 @@ class GainNode(BaseNode):
         timestamp: float,
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
-        # Mix inputs (if any), then apply gain.
-        passthrough = PassthroughNode(
-            name=f"{self.name}_mix",
-            sample_rate=self.sample_rate,
-            channels=self.channels,
-        )
-        mixed = passthrough.process(num_frames=num_frames, timestamp=timestamp, inputs=inputs or [])
-        data = mixed.data * self._gain_linear
-        return AudioFrame(data=data.astype(np.float32, copy=False), sample_rate=self.sample_rate, timestamp=timestamp)
+        out = self._next_output(num_frames)
+        if isinstance(inputs, (list, tuple)) and len(inputs) == 1 and inputs[0].data.shape == out.shape:
+            # Single matching input: scale straight into the output block.
+            data = np.multiply(inputs[0].data, self._gain_linear, out=out)
+        else:
+            # Mix inputs (if any) into the output block, then apply gain in place.
+            data = _mix_inputs(num_frames, self.channels, inputs or (), out=out)
+            data *= self._gain_linear
+        return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+
+
+@lru_cache(maxsize=256)
+def _shelf_sos(kind: str, cutoff_hz: float, gain_db: float, sample_rate: int) -> tuple:
+    """
+    Second-order shelving filter as one SOS row (RBJ cookbook, slope S=1).
+
+    `kind` is "low" or "high"; the gain applies below/above `cutoff_hz`.
+    Returns the six coefficients as an (immutable, memoized) tuple.
+    """
+    # Keep the corner strictly inside (0, Nyquist) for a stable design.
+    cutoff_hz = min(max(cutoff_hz, 1.0), 0.49 * sample_rate)
+    a_lin = 10.0 ** (gain_db / 40.0)
+    w0 = 2.0 * np.pi * cutoff_hz / float(sample_rate)
+    cos_w0 = np.cos(w0)
+    alpha = np.sin(w0) / 2.0 * np.sqrt(2.0)
+    two_sqrt_a_alpha = 2.0 * np.sqrt(a_lin) * alpha
+
+    if kind == "low":
+        b0 = a_lin * ((a_lin + 1) - (a_lin - 1) * cos_w0 + two_sqrt_a_alpha)
+        b1 = 2 * a_lin * ((a_lin - 1) - (a_lin + 1) * cos_w0)
+        b2 = a_lin * ((a_lin + 1) - (a_lin - 1) * cos_w0 - two_sqrt_a_alpha)
+        a0 = (a_lin + 1) + (a_lin - 1) * cos_w0 + two_sqrt_a_alpha
+        a1 = -2 * ((a_lin - 1) + (a_lin + 1) * cos_w0)
+        a2 = (a_lin + 1) + (a_lin - 1) * cos_w0 - two_sqrt_a_alpha
+    elif kind == "high":
+        b0 = a_lin * ((a_lin + 1) + (a_lin - 1) * cos_w0 + two_sqrt_a_alpha)
+        b1 = -2 * a_lin * ((a_lin - 1) + (a_lin + 1) * cos_w0)
+        b2 = a_lin * ((a_lin + 1) + (a_lin - 1) * cos_w0 - two_sqrt_a_alpha)
+        a0 = (a_lin + 1) - (a_lin - 1) * cos_w0 + two_sqrt_a_alpha
+        a1 = 2 * ((a_lin - 1) - (a_lin + 1) * cos_w0)
+        a2 = (a_lin + 1) - (a_lin - 1) * cos_w0 - two_sqrt_a_alpha
+    else:
+        raise ValueError(f"Unknown shelf kind '{kind}'")
+
+    return (float(b0 / a0), float(b1 / a0), float(b2 / a0), 1.0, float(a1 / a0), float(a2 / a0))
 
 
 class EQNode(BaseNode):
     """
-    Simple 3-band EQ implemented in the frequency domain.
+    Simple 3-band EQ built from a cascade of shelving biquads.
 
     Config keys:
       - low_gain_db: float (default 0.0)
@@ -334,8 +603,10 @@ class EQNode(BaseNode):
       - low_cut_hz: float (default 200.0)
       - high_cut_hz: float (default 4000.0)
 
-    This is not a studio-grade EQ but is deterministic and adequate for
-    routing simulations and visual verification.
+    The mid gain is applied broadband, with a low shelf at `low_cut_hz` and a
+    high shelf at `high_cut_hz` moving the outer bands to their own gains.
+    Filter state carries across blocks, so output is continuous and does not
+    depend on block size.
     """
 
     def __init__(
@@ -347,52 +618,61 @@ class EQNode(BaseNode):
     ) -> None:
         super().__init__(name, sample_rate, channels, config)
         cfg = self.config
-        self.low_gain = float(10.0 ** (float(cfg.get("low_gain_db", 0.0)) / 20.0))
-        self.mid_gain = float(10.0 ** (float(cfg.get("mid_gain_db", 0.0)) / 20.0))
-        self.high_gain = float(10.0 ** (float(cfg.get("high_gain_db", 0.0)) / 20.0))
-
         self.low_cut_hz = float(cfg.get("low_cut_hz", 200.0))
         self.high_cut_hz = float(cfg.get("high_cut_hz", 4000.0))
 
+        from scipy import signal
+        self._sosfilt = signal.sosfilt
+
+        self.set_band_gains_db(
+            float(cfg.get("low_gain_db", 0.0)),
+            float(cfg.get("mid_gain_db", 0.0)),
+            float(cfg.get("high_gain_db", 0.0)),
+        )
+        # Filter state: (n_sections, 2, channels) for filtering along axis 0.
+        self._zi = np.zeros((self._sos.shape[0], 2, self.channels), dtype=np.float64)
+
+    def set_band_gains_db(self, low_db: float, mid_db: float, high_db: float) -> None:
+        """
+        Change the band gains without resetting the filter state.
+
+        Safe to call between blocks for parameter automation.
+        """
+        self.low_gain = math.pow(10.0, low_db / 20.0)
+        self.mid_gain = math.pow(10.0, mid_db / 20.0)
+        self.high_gain = math.pow(10.0, high_db / 20.0)
+
+        # Shelves are designed relative to the mid band, which is applied as
+        # a broadband gain folded into the first section's numerator.
+        sos = np.array([
+            _shelf_sos("low", self.low_cut_hz, low_db - mid_db, self.sample_rate),
+            _shelf_sos("high", self.high_cut_hz, high_db - mid_db, self.sample_rate),
+        ], dtype=np.float64)
+        sos[0, :3] *= self.mid_gain
+        self._sos = sos
+
     def process(
         self,
         num_frames: int,
         timestamp: float,
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
-        passthrough = PassthroughNode(
-            name=f"{self.name}_mix",
-            sample_rate=self.sample_rate,
-            channels=self.channels,
-        )
-        mixed = passthrough.process(num_frames=num_frames, timestamp=timestamp, inputs=inputs or [])
-        x = mixed.data  # (N, C)
+        x = _mix_inputs(num_frames, self.channels, inputs or (), out=self._next_output(num_frames))  # (N, C)
 
         if x.size == 0:
-            return AudioFrame(data=x, sample_rate=self.sample_rate, timestamp=timestamp)
-
-        # FFT along time axis for each channel
-        n = x.shape[0]
-        freqs = np.fft.rfftfreq(n, d=1.0 / float(self.sample_rate))
+            return AudioFrame.unchecked(data=x, sample_rate=self.sample_rate, timestamp=timestamp)
 
-        # Determine band masks
-        low_mask = freqs < self.low_cut_hz
-        high_mask = freqs > self.high_cut_hz
-        mid_mask = ~(low_mask | high_mask)
+        # One compiled call filters every channel and carries state forward.
+        y, self._zi = self._sosfilt(self._sos, x, axis=0, zi=self._zi)
 
-        y = np.empty_like(x, dtype=np.float32)
+        np.copyto(x, y, casting="same_kind")
+        return AudioFrame.unchecked(data=x, sample_rate=self.sample_rate, timestamp=timestamp)
 
-        for ch in range(self.channels):
-            spec = np.fft.rfft(x[:, ch])
-            # Apply per-band gains
-            spec[low_mask] *= self.low_gain
-            spec[mid_mask] *= self.mid_gain
-            spec[high_mask] *= self.high_gain
-            # Back to time domain
-            y_ch = np.fft.irfft(spec, n=n)
-            y[:, ch] = y_ch.astype(np.float32, copy=False)
 
-        return AudioFrame(data=y, sample_rate=self.sample_rate, timestamp=timestamp)
+# Delays shorter than this many samples are run through scipy.signal.lfilter:
+# the slice-based path needs one Python-level step per delay length, which
+# costs more than lfilter's compiled O(num_frames * delay) loop below here.
+_DELAY_LFILTER_MAX_SAMPLES = 32
 
 
 class DelayNode(BaseNode):
@@ -424,48 +704,95 @@ class DelayNode(BaseNode):
         self._buffer = np.zeros((self.delay_samples, self.channels), dtype=np.float32)
         self._write_idx = 0
 
+        # Very short delays are evaluated as the equivalent feedback comb
+        # filter: wet[n] = dry[n - D] + feedback * wet[n - D].
+        self._comb: Optional[Tuple[Callable[..., Any], np.ndarray, np.ndarray]] = None
+        if self.delay_samples < _DELAY_LFILTER_MAX_SAMPLES:
+            from scipy import signal
+            b = np.zeros(self.delay_samples + 1, dtype=np.float32)
+            a = np.zeros(self.delay_samples + 1, dtype=np.float32)
+            b[-1] = 1.0
+            a[0] = 1.0
+            a[-1] = -self.feedback
+            self._comb = (signal.lfilter, b, a)
+
+    def _process_comb(
+        self,
+        dry: np.ndarray,
+        comb: Tuple[Callable[..., Any], np.ndarray, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Compute the wet signal with scipy.signal.lfilter; `comb` is self._comb.
+
+        For this filter the lfilter state is exactly the circular buffer in
+        chronological order (oldest first), so the two representations
+        convert into each other with a roll.
+        """
+        lfilter, b, a = comb
+        zi = np.roll(self._buffer, -self._write_idx, axis=0)
+        wet, self._buffer = lfilter(b, a, dry, axis=0, zi=zi)
+        self._write_idx = 0
+        return wet
+
+    def _process_blocks(self, dry: np.ndarray) -> np.ndarray:
+        """Compute the wet signal with slice operations on the circular buffer."""
+        num_frames = dry.shape[0]
+        wet = self._get_scratch(len(dry))
+
+        # The circular buffer holds exactly delay_samples entries, so each
+        # sample reads the slot it is about to overwrite (written delay_samples
+        # ago). Within a contiguous run of slots up to the wrap point no slot
+        # is visited twice, so a whole run can be read and rewritten with
+        # slice operations. Short delays just take more runs per block.
+        buf = self._buffer
+        write_idx = self._write_idx
+        pos = 0
+        while pos < num_frames:
+            k = min(num_frames - pos, self.delay_samples - write_idx)
+            segment = buf[write_idx:write_idx + k]
+
+            # Output the delayed signal
+            wet[pos:pos + k] = segment
+
+            # Write new values into the buffer (with feedback)
+            np.multiply(segment, self.feedback, out=segment)
+            segment += dry[pos:pos + k]
+
+            pos += k
+            write_idx += k
+            if write_idx >= self.delay_samples:
+                write_idx = 0
+        self._write_idx = write_idx
+        return wet
+
     def process(
         self,
         num_frames: int,
         timestamp: float,
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
-        passthrough = PassthroughNode(
-            name=f"{self.name}_mix",
-            sample_rate=self.sample_rate,
-            channels=self.channels,
-        )
-        mixed = passthrough.process(num_frames=num_frames, timestamp=timestamp, inputs=inputs or [])
-        dry = mixed.data
+        dry = _mix_inputs(num_frames, self.channels, inputs or (), out=self._next_output(num_frames))
 
         if dry.size == 0:
-            return AudioFrame(data=dry, sample_rate=self.sample_rate, timestamp=timestamp)
+            return AudioFrame.unchecked(data=dry, sample_rate=self.sample_rate, timestamp=timestamp)
 
-        wet = np.zeros_like(dry, dtype=np.float32)
-
-        # Sample-by-sample processing with circular buffer
-        # Read pointer is delay_samples behind write pointer
-        for i in range(num_frames):
-            # Calculate read position: delay_samples behind write position
-            read_idx = (self._write_idx - self.delay_samples) % self.delay_samples
-            
-            # Read delayed signal from read pointer (copy to avoid view issues)
-            delayed = self._buffer[read_idx].copy()  # (channels,)
-            inp = dry[i].copy()
-
-            # Write new value into buffer at write pointer (with feedback)
-            self._buffer[self._write_idx] = inp + delayed * self.feedback
+        comb = self._comb
+        if comb is not None:
+            wet = self._process_comb(dry, comb)
+        else:
+            wet = self._process_blocks(dry)
 
-            # Output the delayed signal
-            wet[i] = delayed
+        # The wet signal is already computed, so blend into the dry block in place.
+        out = dry
+        out *= 1.0 - self.mix
+        wet *= self.mix
+        out += wet
+        return AudioFrame.unchecked(data=out, sample_rate=self.sample_rate, timestamp=timestamp)
 
-            # Advance write pointer
-            self._write_idx += 1
-            if self._write_idx >= self.delay_samples:
-                self._write_idx = 0
 
-        out = (1.0 - self.mix) * dry + self.mix * wet
-        return AudioFrame(data=out.astype(np.float32, copy=False), sample_rate=self.sample_rate, timestamp=timestamp)
+# Number of device blocks AudioInputNode keeps; the callback cycles through
+# them so it never writes into the block `process` is reading.
+_INPUT_RING_SLOTS = 4
 
 
 class AudioInputNode(BaseNode):
@@ -476,6 +803,9 @@ class AudioInputNode(BaseNode):
       - device: int or str (optional) - audio device ID or name
       - channels: int (default 2) - number of input channels
     """
+
+    # The device stream is opened with the first block size it sees.
+    supports_variable_block_size = False
     
     def __init__(
         self,
@@ -493,24 +823,22 @@ class AudioInputNode(BaseNode):
         
         self._device = config.get("device") if config else None
         self._stream = None
-        self._buffer = None
-        self._buffer_lock = None
-        
-        try:
-            import threading
-            self._buffer_lock = threading.Lock()
-        except ImportError:
-            pass
+        # (slots, block, channels) capture ring, allocated when the stream opens.
+        self._ring: Optional[np.ndarray] = None
+        self._write_slot = 0
+        # (slot, frames) of the newest complete block. Published with a single
+        # attribute assignment, so the callback needs no lock.
+        self._latest: Optional[tuple] = None
 
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for sounddevice input stream."""
         if status:
             print(f"Audio input status: {status}")
-        if self._buffer_lock:
-            with self._buffer_lock:
-                self._buffer = indata.copy()
-        else:
-            self._buffer = indata.copy()
+        slot = self._write_slot
+        frames = min(frames, self._ring.shape[1])
+        np.copyto(self._ring[slot, :frames], indata[:frames])
+        self._latest = (slot, frames)
+        self._write_slot = (slot + 1) % _INPUT_RING_SLOTS
 
     def process(
         self,
@@ -521,6 +849,8 @@ class AudioInputNode(BaseNode):
         # Start stream if not running
         if self._stream is None or not self._stream.active:
             try:
+                if self._ring is None:
+                    self._ring = np.zeros((_INPUT_RING_SLOTS, num_frames, self.channels), dtype=np.float32)
                 self._stream = self._sd.InputStream(
                     samplerate=self.sample_rate,
                     channels=self.channels,
@@ -533,30 +863,23 @@ class AudioInputNode(BaseNode):
             except Exception as e:
                 print(f"Failed to start audio input: {e}")
                 # Return silence on error
-                data = np.zeros((num_frames, self.channels), dtype=np.float32)
-                return AudioFrame(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+                data = self._silence(num_frames)
+                return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
         
         # Get latest buffer
-        if self._buffer_lock:
-            with self._buffer_lock:
-                buffer = self._buffer.copy() if self._buffer is not None else None
-        else:
-            buffer = self._buffer.copy() if self._buffer is not None else None
-        
-        if buffer is None or len(buffer) == 0:
+        latest = self._latest
+        if latest is None or latest[1] == 0:
             # No data yet, return silence
-            data = np.zeros((num_frames, self.channels), dtype=np.float32)
+            data = self._silence(num_frames)
         else:
-            # Ensure correct shape and length
-            if buffer.shape[0] < num_frames:
-                pad = np.zeros((num_frames - buffer.shape[0], self.channels), dtype=np.float32)
-                data = np.vstack([buffer, pad]).astype(np.float32)
-            elif buffer.shape[0] > num_frames:
-                data = buffer[:num_frames].astype(np.float32, copy=False)
-            else:
-                data = buffer.astype(np.float32, copy=False)
+            # Copy into our own block (pad or truncate to num_frames)
+            slot, frames = latest
+            k = min(frames, num_frames)
+            data = self._next_output(num_frames)
+            data[:k] = self._ring[slot, :k]
+            data[k:] = 0.0
         
-        return AudioFrame(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
+        return AudioFrame.unchecked(data=data, sample_rate=self.sample_rate, timestamp=timestamp)
     
     def __del__(self):
         """Clean up audio stream."""
@@ -568,17 +891,28 @@ class AudioInputNode(BaseNode):
                 pass
 
 
+# AudioOutputNode ring buffer capacity, in blocks of the stream's block size.
+_OUTPUT_RING_BLOCKS = 8
+
+
 class AudioOutputNode(BaseNode):
     """
     Play audio to speakers/output device using sounddevice.
     
     This node consumes its input and plays it to the audio output.
     It returns silence (since audio is consumed by output).
+
+    Blocks are queued in a ring buffer that the device callback drains, so
+    `process` never waits on the device. Samples that do not fit in the ring
+    are dropped; the device plays silence when the ring runs dry.
     
     Config keys:
       - device: int or str (optional) - audio device ID or name
       - channels: int (default 2) - number of output channels
     """
+
+    # The device stream is opened with the first block size it sees.
+    supports_variable_block_size = False
     
     def __init__(
         self,
@@ -596,14 +930,45 @@ class AudioOutputNode(BaseNode):
         
         self._device = config.get("device") if config else None
         self._stream = None
-        self._queue = []
-        self._queue_lock = None
-        
-        try:
-            import threading
-            self._queue_lock = threading.Lock()
-        except ImportError:
-            pass
+        self._ring: Optional[np.ndarray] = None
+        self._ring_read = 0
+        self._ring_fill = 0
+        self._ring_lock = threading.Lock()
+
+    def _write_ring(self, data: np.ndarray) -> None:
+        """Queue `data` for playback, dropping whatever does not fit."""
+        ring = self._ring
+        if ring is None:
+            return
+        size = len(ring)
+        with self._ring_lock:
+            n = min(len(data), size - self._ring_fill)
+            start = (self._ring_read + self._ring_fill) % size
+            first = min(n, size - start)
+            ring[start:start + first] = data[:first]
+            ring[:n - first] = data[first:n]
+            self._ring_fill += n
+
+    def _audio_callback(self, outdata, frames, time_info, status):
+        """Callback for sounddevice output stream."""
+        if status:
+            print(f"Audio output status: {status}")
+        ring = self._ring
+        if ring is None:
+            # Not allocated yet (first process() call): play silence.
+            outdata[:] = 0.0
+            return
+        size = len(ring)
+        with self._ring_lock:
+            n = min(frames, self._ring_fill)
+            start = self._ring_read
+            first = min(n, size - start)
+            outdata[:first] = ring[start:start + first]
+            outdata[first:n] = ring[:n - first]
+            self._ring_read = (start + n) % size
+            self._ring_fill -= n
+        # Underrun: pad with silence.
+        outdata[n:] = 0.0
 
     def process(
         self,
@@ -612,41 +977,34 @@ class AudioOutputNode(BaseNode):
         inputs: Optional[Iterable[AudioFrame]] = None,
     ) -> AudioFrame:
         # Mix inputs
-        passthrough = PassthroughNode(
-            name=f"{self.name}_mix",
-            sample_rate=self.sample_rate,
-            channels=self.channels,
-        )
-        mixed = passthrough.process(num_frames=num_frames, timestamp=timestamp, inputs=inputs or [])
-        audio_data = mixed.data
+        audio_data = _mix_inputs(num_frames, self.channels, inputs or (), out=self._get_scratch(num_frames))
         
         # Start stream if not running
         if self._stream is None or not self._stream.active:
             try:
+                if self._ring is None:
+                    self._ring = np.zeros((num_frames * _OUTPUT_RING_BLOCKS, self.channels), dtype=np.float32)
                 self._stream = self._sd.OutputStream(
                     samplerate=self.sample_rate,
                     channels=self.channels,
                     dtype='float32',
                     device=self._device,
+                    callback=self._audio_callback,
                     blocksize=num_frames,
                 )
                 self._stream.start()
             except Exception as e:
                 print(f"Failed to start audio output: {e}")
                 # Return silence on error
-                return AudioFrame(data=np.zeros((num_frames, self.channels), dtype=np.float32), 
+                return AudioFrame.unchecked(data=self._silence(num_frames),
                                 sample_rate=self.sample_rate, timestamp=timestamp)
         
-        # Play audio (non-blocking write)
-        try:
-            if self._stream.active:
-                self._stream.write(audio_data)
-        except Exception as e:
-            print(f"Error writing to audio output: {e}")
+        # Queue audio for the device callback (never blocks on the device)
+        self._write_ring(audio_data)
         
         # Output node returns silence (audio is consumed)
-        return AudioFrame(
-            data=np.zeros((num_frames, self.channels), dtype=np.float32),
+        return AudioFrame.unchecked(
+            data=self._silence(num_frames),
             sample_rate=self.sample_rate,
             timestamp=timestamp
         )
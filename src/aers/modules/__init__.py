@@ -12,9 +12,12 @@ from __future__ import annotations
 import importlib
 import inspect
 import os
+import time
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional, Type
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Type
 
 from aers.core.nodes import (
     BaseNode,
@@ -27,7 +30,9 @@ from aers.core.nodes import (
     PassthroughNode,
     SineSourceNode,
 )
-from aers.security import load_manifest, verify_manifest_hash, PluginManifest
+
+if TYPE_CHECKING:
+    from aers.security import PluginManifest
 
 
 # ---------------------------------------------------------------------------
@@ -54,9 +59,24 @@ NODE_TYPE_REGISTRY: Mapping[str, Type[BaseNode]] = {
 # In a real deployment this would be something like "aers_plugins."
 ALLOWED_PLUGIN_PACKAGE_PREFIXES = ("example_gain_plugin", "aers_plugins")
 
+# Precomputed forms for _ensure_allowed_prefix: exact package names and
+# dotted prefixes for a single str.startswith(tuple) call.
+_ALLOWED_PLUGIN_PACKAGES = frozenset(ALLOWED_PLUGIN_PACKAGE_PREFIXES)
+_ALLOWED_PLUGIN_SUBMODULE_PREFIXES = tuple(p + "." for p in ALLOWED_PLUGIN_PACKAGE_PREFIXES)
+
 # Root directory where plugin packages are stored (adjust as needed).
 DEFAULT_PLUGIN_ROOT = Path(os.getenv("AERS_PLUGIN_ROOT", "plugins")).resolve()
 
+# Manifests that passed hash verification, keyed by (manifest path, mtime_ns,
+# size). Each entry keeps the plugin root and its stat signature at
+# verification time; a re-verify happens only if either file set changed.
+_VERIFIED_MANIFESTS: Dict[Tuple[str, int, int], Tuple[PluginManifest, Path, tuple]] = {}
+
+# Files modified this recently when verified can be rewritten without their
+# mtime changing (filesystem timestamps are coarse), so the stat signature
+# cannot vouch for them and the result is not cached.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
 
 @dataclass
 class NodeConfig:
@@ -87,7 +107,9 @@ def get_node_class(
 
     Raises KeyError if the kind is unknown.
     """
-    kind = kind.lower()
+    # Configs almost always use canonical lowercase kinds; skip the copy then.
+    if not kind.islower():
+        kind = kind.lower()
 
     # 1) Built-in lookup
     cls = NODE_TYPE_REGISTRY.get(kind)
@@ -112,17 +134,7 @@ def get_node_class(
                 f"Kind '{kind}' not allowed by plugin manifest '{manifest.name}'"
             )
         module_path = manifest.module
-        _ensure_allowed_prefix(module_path)
-        module = importlib.import_module(module_path)
-
-        # Convention: plugin exports a mapping PLUGIN_NODE_TYPES
-        plugin_registry = getattr(module, "PLUGIN_NODE_TYPES", None)
-        if not isinstance(plugin_registry, dict):
-            raise KeyError(
-                f"Plugin module '{module_path}' must define PLUGIN_NODE_TYPES dict"
-            )
-
-        cls = plugin_registry.get(kind)
+        cls = _plugin_node_types(module_path).get(kind)
         if cls is None:
             raise KeyError(
                 f"Kind '{kind}' not found in plugin module '{module_path}'"
@@ -166,8 +178,7 @@ def create_node_instance(
     cls = get_node_class(kind, config=config, manifest=manifest)
 
     # Ensure the class has the expected signature
-    sig = inspect.signature(cls.__init__)
-    if "name" not in sig.parameters:
+    if not _accepts_name(cls):
         raise TypeError(
             f"Node class '{cls.__name__}' must accept 'name' argument in __init__"
         )
@@ -180,15 +191,40 @@ def create_node_instance(
 # ---------------------------------------------------------------------------
 
 
+@cache
+def _accepts_name(cls: Type[BaseNode]) -> bool:
+    """Whether `cls.__init__` takes a `name` parameter (memoized per class)."""
+    return "name" in inspect.signature(cls.__init__).parameters
+
+
+@cache
+def _plugin_node_types(module_path: str) -> Mapping[str, Type[BaseNode]]:
+    """
+    Import a manifest plugin module and return its PLUGIN_NODE_TYPES.
+
+    Resolved once per module path; later lookups skip the import machinery.
+    """
+    _ensure_allowed_prefix(module_path)
+    module = importlib.import_module(module_path)
+
+    # Convention: plugin exports a mapping PLUGIN_NODE_TYPES
+    plugin_registry = getattr(module, "PLUGIN_NODE_TYPES", None)
+    if not isinstance(plugin_registry, dict):
+        raise KeyError(
+            f"Plugin module '{module_path}' must define PLUGIN_NODE_TYPES dict"
+        )
+    return MappingProxyType(dict(plugin_registry))
+
+
 def _ensure_allowed_prefix(module_path: str) -> None:
     """
     Ensure that a plugin module path uses an allowed prefix.
 
     This prevents arbitrary imports such as 'os', 'subprocess', etc.
     """
-    if not any(
-        module_path.startswith(prefix + ".") or module_path == prefix
-        for prefix in ALLOWED_PLUGIN_PACKAGE_PREFIXES
+    if not (
+        module_path in _ALLOWED_PLUGIN_PACKAGES
+        or module_path.startswith(_ALLOWED_PLUGIN_SUBMODULE_PREFIXES)
     ):
         raise ImportError(
             f"Plugin module '{module_path}' not allowed; "
@@ -196,12 +232,16 @@ def _ensure_allowed_prefix(module_path: str) -> None:
         )
 
 
+@cache
 def _load_plugin_node_class(module_path: str, class_name: str) -> Type[BaseNode]:
     """
     Load a plugin node class from a Python module in a restricted namespace.
 
     Only modules whose dotted path begins with one of the ALLOWED_PLUGIN_PACKAGE_PREFIXES
     are accepted. This prevents arbitrary code execution from untrusted configs.
+
+    Successful lookups are memoized per (module_path, class_name); failures
+    are not cached and are re-checked on the next call.
     """
     _ensure_allowed_prefix(module_path)
 
@@ -225,20 +265,61 @@ def _load_and_verify_plugin_manifest(manifest_path: str) -> PluginManifest:
 
     - Ensures the manifest is structurally valid
     - Verifies that the hash matches the plugin directory contents
+
+    Results are cached; while neither the manifest nor any plugin file has
+    changed on disk (by mtime/size), the directory is not re-hashed. Trees
+    with files modified within the last _RACY_MTIME_WINDOW_NS are never
+    cached, since a same-size rewrite could keep their mtime.
     """
-    manifest = load_manifest(manifest_path)
+    # Plugin security is only needed when a manifest is actually used.
+    from aers.security import directory_signature, load_manifest, verify_manifest_hash
+
+    manifest_file = Path(manifest_path).resolve()
+    try:
+        st = manifest_file.stat()
+        cache_key = (str(manifest_file), st.st_mtime_ns, st.st_size)
+    except OSError:
+        cache_key = None
+
+    cached = _VERIFIED_MANIFESTS.get(cache_key) if cache_key else None
+    if cached is not None:
+        manifest, plugin_root, signature = cached
+        if directory_signature(plugin_root) == signature:
+            return manifest
+
+    manifest = load_manifest(manifest_file)
 
     # Infer plugin root directory based on manifest and DEFAULT_PLUGIN_ROOT
     plugin_root = DEFAULT_PLUGIN_ROOT / manifest.name
+    # Taken before hashing so edits made while hashing invalidate the entry.
+    verified_at_ns = time.time_ns()
+    signature = directory_signature(plugin_root)
     if not verify_manifest_hash(manifest, plugin_root):
         raise ValueError(
             f"Plugin hash mismatch for '{manifest.name}'; "
             f"plugin directory may have been modified."
         )
 
+    if cache_key:
+        newest_mtime_ns = max([cache_key[1]] + [mtime_ns for _, mtime_ns, _ in signature])
+        if newest_mtime_ns < verified_at_ns - _RACY_MTIME_WINDOW_NS:
+            _VERIFIED_MANIFESTS[cache_key] = (manifest, plugin_root, signature)
     return manifest
 
 
+_LAZY_SECURITY_NAMES = frozenset({"PluginManifest", "load_manifest", "verify_manifest_hash"})
+
+
+def __getattr__(name: str) -> Any:
+    # Plugin security helpers used to be imported here eagerly; keep them
+    # reachable as module attributes without paying for the import up front.
+    if name in _LAZY_SECURITY_NAMES:
+        import aers.security
+
+        return getattr(aers.security, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BaseNode",
     "SineSourceNode",
@@ -11,6 +11,10 @@ from aers.core.nodes import Node, AudioBuffer, NodeContext, NodeError
 from . import register_node_type
 
 
+# 10 ** (db / 20) == exp(db * ln(10) / 20)
+_LN10_OVER_20 = math.log(10.0) / 20.0
+
+
 class Gain(Node):
     """
     Simple gain node.
@@ -29,20 +33,51 @@ class Gain(Node):
         super().__init__(node_id=node_id, params=params, context=context)
         raw_gain = self.params.get("gain_db", 0.0)
         try:
-            self._gain_db = float(raw_gain)
+            self.gain_db = float(raw_gain)
         except (TypeError, ValueError) as exc:
             raise NodeError(f"{self.id}: invalid gain_db value {raw_gain!r}") from exc
 
+    @property
+    def gain_db(self) -> float:
+        return self._gain_db
+
+    @gain_db.setter
+    def gain_db(self, value: float) -> None:
+        self._gain_db = float(value)
+        self._factor = np.float32(self._db_to_linear(self._gain_db))
+        # Pick the kernel once per gain change: unity gain is a bypass and
+        # -inf dB (factor 0) is a mute, neither of which needs a multiply.
+        # The kernels are staticmethods, so storing one keeps a plain
+        # function rather than a bound method (no self -> self cycle).
+        if self._factor == 1.0:
+            self._apply = self._apply_bypass
+        elif self._factor == 0.0:
+            self._apply = self._apply_mute
+        else:
+            self._apply = self._apply_scale
+
     def process(self, buffer: AudioBuffer, timestamp: float) -> AudioBuffer:
+        """Return a new float32 buffer scaled by the gain; `buffer` is not modified."""
         if not isinstance(buffer, np.ndarray):
             raise NodeError(f"{self.id}: buffer must be numpy.ndarray")
-        factor = self._db_to_linear(self._gain_db)
-        # Multiply in float32 space
-        return (buffer.astype(np.float32, copy=False) * factor).astype(np.float32, copy=False)
+        return self._apply(buffer, self._factor)
+
+    @staticmethod
+    def _apply_bypass(buffer: np.ndarray, factor: np.float32) -> np.ndarray:
+        return buffer.astype(np.float32)
+
+    @staticmethod
+    def _apply_mute(buffer: np.ndarray, factor: np.float32) -> np.ndarray:
+        return np.zeros(buffer.shape, dtype=np.float32)
+
+    @staticmethod
+    def _apply_scale(buffer: np.ndarray, factor: np.float32) -> np.ndarray:
+        # Multiply in float32 space, one pass, converting on the fly
+        return np.multiply(buffer, factor, dtype=np.float32)
 
     @staticmethod
     def _db_to_linear(db_value: float) -> float:
-        return math.pow(10.0, db_value / 20.0)
+        return math.exp(db_value * _LN10_OVER_20)
 
 
 # Register under a simple logical type name
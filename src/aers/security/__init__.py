@@ -9,6 +9,7 @@ This package focuses on:
 
 from .manifest import (
     PluginManifest,
+    directory_signature,
     load_manifest,
     verify_manifest_hash,
     validate_manifest,
@@ -16,6 +17,7 @@ from .manifest import (
 
 __all__ = [
     "PluginManifest",
+    "directory_signature",
     "load_manifest",
     "verify_manifest_hash",
     "validate_manifest",
@@ -1,14 +1,14 @@
 import hashlib
 import json
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any
 
-import yaml
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PluginManifest:
     """
     Declarative description of a plugin package.
@@ -19,10 +19,13 @@ class PluginManifest:
     version: "1.0.0"
     module: "example_gain_plugin.gain"
     hash:
-      algorithm: "sha256"
+      algorithm: "sha256"   # or "blake3"
       value: "<hex-digest-of-plugin-dir>"
     allowed_node_kinds:
       - "gain"
+
+    Instances are validated on construction, so a PluginManifest is always
+    structurally valid.
     """
 
     name: str
@@ -32,6 +35,9 @@ class PluginManifest:
     hash_value: str
     allowed_node_kinds: list[str]
 
+    def __post_init__(self) -> None:
+        validate_manifest(self)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PluginManifest":
         try:
@@ -67,24 +73,29 @@ def load_manifest(path: str | os.PathLike[str]) -> PluginManifest:
 
     Raises ValueError if validation fails.
     """
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it; same safe semantics.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     path_obj = Path(path)
     if not path_obj.is_file():
         raise FileNotFoundError(f"Plugin manifest not found: {path_obj}")
 
     with path_obj.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=loader)
 
     if not isinstance(data, dict):
         raise ValueError(f"Invalid manifest structure in {path_obj}")
 
-    manifest = PluginManifest.from_dict(data)
-    validate_manifest(manifest)
-    return manifest
+    return PluginManifest.from_dict(data)
 
 
 def validate_manifest(manifest: PluginManifest) -> None:
     """
     Basic structural validation. This is intentionally strict but simple.
+
+    Runs automatically when a PluginManifest is constructed.
     """
     if not manifest.name:
         raise ValueError("Manifest 'name' cannot be empty")
@@ -92,7 +103,7 @@ def validate_manifest(manifest: PluginManifest) -> None:
         raise ValueError("Manifest 'version' cannot be empty")
     if "." not in manifest.module:
         raise ValueError("Manifest 'module' must be a fully qualified module path")
-    if manifest.hash_algorithm not in ("sha256",):
+    if manifest.hash_algorithm not in _HASH_ALGORITHMS:
         raise ValueError(f"Unsupported hash algorithm: {manifest.hash_algorithm}")
     if not manifest.hash_value or len(manifest.hash_value) < 32:
         raise ValueError("Manifest 'hash.value' appears invalid (too short)")
@@ -100,39 +111,143 @@ def validate_manifest(manifest: PluginManifest) -> None:
         raise ValueError("Manifest must declare at least one allowed_node_kinds")
 
 
+# sha256 is the default; blake3 (optional dependency) suits large bundles.
+_HASH_ALGORITHMS = ("sha256", "blake3")
+
+# Files at least this large are hashed through mmap instead of read().
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _update_digest_from_file(digest: "hashlib._Hash", path: str | os.PathLike[str]) -> None:
+    """
+    Feed the bytes of `path` into `digest`.
+
+    Small files are read in one call; large ones are memory-mapped so OpenSSL
+    hashes the mapping directly without a Python-level read loop. The bytes
+    fed are identical either way, so the resulting hash does not change.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest.update(mm)
+                return
+            except (OSError, ValueError):
+                # Not mappable (e.g. special file); stream it instead.
+                f.seek(0)
+        while chunk := f.read(_MMAP_THRESHOLD):
+            digest.update(chunk)
+
+
+def _hash_file_sha256(path: str | os.PathLike[str]) -> bytes:
+    """Return the raw SHA256 digest of a single file."""
+    digest = hashlib.sha256()
+    _update_digest_from_file(digest, path)
+    return digest.digest()
+
+
+def _plugin_files(root: Path) -> list[tuple[str, str]]:
+    """
+    (relative path, full path) of every file covered by the directory hash.
+
+    Hidden entries and __pycache__ are pruned where they are found, so their
+    subtrees are never scanned; symlinked directories are not followed.
+    Sorted by path components, the order Path-based walks used.
+    """
+    found: list[tuple[tuple[str, ...], str]] = []
+    stack: list[tuple[str, tuple[str, ...]]] = [(os.fspath(root), ())]
+    while stack:
+        dir_path, rel_parts = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or name == "__pycache__":
+                    continue
+                parts = rel_parts + (name,)
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append((entry.path, parts))
+                    continue
+                found.append((parts, entry.path))
+
+    found.sort()
+    return [(os.path.join(*parts), path) for parts, path in found]
+
+
+def directory_signature(root: str | os.PathLike[str]) -> tuple:
+    """
+    Cheap stat-based fingerprint of the files covered by the directory hash.
+
+    Any added, removed, resized or touched file changes the signature, so it
+    can gate re-use of an earlier full hash verification.
+    """
+    signature = []
+    for rel_path, path in _plugin_files(Path(root)):
+        st = os.stat(path)
+        signature.append((rel_path, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
 def _hash_directory_sha256(root: Path) -> str:
     """
     Compute a deterministic SHA256 hash of all files under the directory.
 
     - Walks the directory in sorted order
     - Ignores __pycache__ and hidden directories
-    - Includes relative path + file bytes in digest
+    - Includes relative path + SHA256 digest of each file's bytes
+
+    Files are hashed concurrently (OpenSSL releases the GIL while hashing),
+    then folded into the directory digest in walk order.
     """
+    files = _plugin_files(root)
+    if len(files) > 1:
+        workers = min(32, os.cpu_count() or 1, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            file_digests = list(pool.map(_hash_file_sha256, [path for _, path in files]))
+    else:
+        file_digests = [_hash_file_sha256(path) for _, path in files]
+
     digest = hashlib.sha256()
+    for (rel_path, _), file_digest in zip(files, file_digests):
+        digest.update(rel_path.encode("utf-8"))
+        digest.update(file_digest)
 
-    for path in sorted(root.rglob("*")):
-        if path.is_dir():
-            # Ignore hidden and __pycache__ directories
-            parts = path.parts
-            if any(p.startswith(".") for p in parts):
-                continue
-            if "__pycache__" in parts:
-                continue
-            continue
+    return digest.hexdigest()
 
-        if path.name.startswith("."):
-            continue
 
-        rel_path = path.relative_to(root)
-        digest.update(str(rel_path).encode("utf-8"))
+def _hash_directory_blake3(root: Path) -> str:
+    """
+    BLAKE3 counterpart of _hash_directory_sha256, using the same fold of
+    relative path + per-file digest.
+
+    blake3 already spreads a single large file across cores, so files are
+    hashed one after another rather than on a thread pool.
+    """
+    try:
+        import blake3
+    except ImportError:
+        raise ImportError("blake3 is required for blake3 plugin hashes. Install with: pip install blake3")
 
-        with path.open("rb") as f:
-            while chunk := f.read(8192):
-                digest.update(chunk)
+    digest = blake3.blake3()
+    for rel_path, path in _plugin_files(root):
+        file_digest = blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(path).digest()
+        digest.update(rel_path.encode("utf-8"))
+        digest.update(file_digest)
 
     return digest.hexdigest()
 
 
+_DIRECTORY_HASHERS = {
+    "sha256": _hash_directory_sha256,
+    "blake3": _hash_directory_blake3,
+}
+
+
 def verify_manifest_hash(manifest: PluginManifest, plugin_root: str | os.PathLike[str]) -> bool:
     """
     Verify that the hash in the manifest matches the plugin directory contents.
@@ -143,10 +258,11 @@ def verify_manifest_hash(manifest: PluginManifest, plugin_root: str | os.PathLik
     if not root.is_dir():
         raise FileNotFoundError(f"Plugin directory not found: {root}")
 
-    if manifest.hash_algorithm != "sha256":
+    hasher = _DIRECTORY_HASHERS.get(manifest.hash_algorithm)
+    if hasher is None:
         raise ValueError(f"Unsupported hash algorithm: {manifest.hash_algorithm}")
 
-    computed = _hash_directory_sha256(root)
+    computed = hasher(root)
     return computed == manifest.hash_value
 
 
@@ -1,71 +1,132 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional, Union
 import math
 
+import numpy as np
+import orjson
+
 from aers.core.events import AudioFrame
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeMetric:
-    """Single-node metric snapshot suitable for serialization to JSON."""
+    """
+    Single-node metric snapshot.
+
+    Serialized as-is by orjson (native dataclass support); `file_info` is
+    null for nodes without file metadata. `peak` and `rms` are left as NumPy
+    float scalars on the single-block path (no float() boxing per node);
+    encode_batch passes OPT_SERIALIZE_NUMPY so orjson writes them as numbers.
+    """
 
     name: str
-    peak: float
-    rms: float
+    peak: Union[float, np.floating]
+    rms: Union[float, np.floating]
     num_frames: int
     num_channels: int
     # Optional file metadata (for AudioFileSourceNode)
     file_info: Optional[Dict[str, Any]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "name": self.name,
-            "peak": self.peak,
-            "rms": self.rms,
-            "num_frames": self.num_frames,
-            "num_channels": self.num_channels,
-        }
-        if self.file_info:
-            result["file_info"] = self.file_info
-        return result
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricsSnapshot:
     """Aggregate metrics for all nodes at a given wall-clock timestamp."""
 
     timestamp: float  # seconds since epoch
     nodes: List[NodeMetric]
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp,
-            "nodes": [n.to_dict() for n in self.nodes],
-        }
+
+def encode_batch(snapshots: List[MetricsSnapshot]) -> bytes:
+    """Serialize several snapshots as one `{"batch": [...]}` message."""
+    return orjson.dumps({"batch": snapshots}, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Samples reduced per chunk in _peak_and_rms; small enough that the second
+# reduction over a chunk reads it back from cache rather than memory.
+_METRICS_CHUNK = 16_384
+
+
+def _peak_and_rms(samples: np.ndarray) -> tuple:
+    """
+    Return (peak, rms) over all channels and frames.
+
+    Peak and sum of squares are reduced chunk by chunk, so each sample is
+    pulled from memory once even for large (batched) blocks. The sum of
+    squares is a float32 dot product; no squared or abs temporaries.
+    """
+    flat = samples.ravel()
+    n = flat.size
+    if n == 0:
+        return 0.0, 0.0
+    if n <= _METRICS_CHUNK:
+        # Common case (one block): stay in NumPy scalars, no float() boxing.
+        return max(-flat.min(), flat.max()), (np.dot(flat, flat) / n) ** 0.5
+    peak = 0.0
+    sumsq = 0.0
+    for start in range(0, n, _METRICS_CHUNK):
+        chunk = flat[start:start + _METRICS_CHUNK]
+        peak = max(peak, -float(chunk.min()), float(chunk.max()))
+        sumsq += float(np.dot(chunk, chunk))
+    return peak, math.sqrt(sumsq / n)
 
 
 def frame_to_metrics(name: str, frame: AudioFrame) -> NodeMetric:
     """
     Compute metrics for a single AudioFrame.
 
-    Peak is taken from frame.peak (already max abs sample).
-    RMS is computed per-frame across all samples.
+    Peak (max abs sample) and RMS are computed together across all samples.
     """
-    samples = frame.data
-    if samples.size == 0:
-        rms_value = 0.0
-    else:
-        # RMS over all channels and frames
-        sq = (samples.astype("float64") ** 2).mean()
-        rms_value = math.sqrt(float(sq))
+    peak, rms_value = _peak_and_rms(frame.data)
 
     return NodeMetric(
         name=name,
-        peak=float(frame.peak),
-        rms=float(rms_value),
+        peak=peak,
+        rms=rms_value,
         num_frames=frame.num_frames,
         num_channels=frame.num_channels,
     )
 
+
+# Below this many same-shape frames, the stacking copy costs more than the
+# per-node NumPy calls it saves.
+_STACK_MIN_FRAMES = 4
+
+
+def frames_to_metrics(frames: Mapping[str, AudioFrame]) -> List[NodeMetric]:
+    """
+    Compute metrics for every node output of one block, in mapping order.
+
+    Frames of the same shape are stacked and reduced together, so NumPy's
+    per-call overhead is paid once per shape instead of once per node
+    (for groups of at least _STACK_MIN_FRAMES).
+    Oversized (batched) frames go through frame_to_metrics, which reduces
+    them chunk by chunk.
+    """
+    groups: Dict[tuple, List[str]] = {}
+    for name, frame in frames.items():
+        groups.setdefault(frame.data.shape, []).append(name)
+
+    metrics: Dict[str, NodeMetric] = {}
+    for shape, names in groups.items():
+        n = math.prod(shape)
+        if len(names) < _STACK_MIN_FRAMES or n == 0 or n > _METRICS_CHUNK:
+            for name in names:
+                metrics[name] = frame_to_metrics(name=name, frame=frames[name])
+            continue
+
+        stacked = np.stack([frames[name].data for name in names]).reshape(len(names), n)
+        peaks = np.maximum(stacked.max(axis=1), -stacked.min(axis=1)).tolist()
+        rms_values = np.sqrt(np.einsum("ij,ij->i", stacked, stacked) / n).tolist()
+        num_frames, num_channels = frames[names[0]].num_frames, frames[names[0]].num_channels
+        for name, peak, rms_value in zip(names, peaks, rms_values):
+            metrics[name] = NodeMetric(
+                name=name,
+                peak=peak,
+                rms=rms_value,
+                num_frames=num_frames,
+                num_channels=num_channels,
+            )
+
+    return [metrics[name] for name in frames]
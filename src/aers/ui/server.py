@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import dataclasses
 import logging
+import logging.handlers
 import os
+import queue
 import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Any, Callable, Dict, List, Set, Optional, Tuple
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException, Request
+import orjson
+from fastapi import FastAPI, WebSocket, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response
 
-from aers.core.graph_engine import GraphEngine
-from aers.ui.metrics import MetricsSnapshot, frame_to_metrics
-from aers.utils.config_loader import load_routing_config
+from aers.core.graph_engine import Connection, GraphEngine, NodeSpec
+from aers.ui.metrics import MetricsSnapshot, encode_batch, frames_to_metrics
+from aers.utils.config_loader import RoutingConfig, load_routing_config, write_routing_config
 
 # Set up logging
 logger = logging.getLogger("aers.ui.server")
@@ -25,43 +31,80 @@ log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 log_file = log_dir / "aers_server.log"
 
-# Create file handler
-file_handler = logging.FileHandler(log_file)
-file_handler.setLevel(logging.INFO)
-file_formatter = logging.Formatter(
+# One formatter shared by both handlers
+log_formatter = logging.Formatter(
     "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S"
 )
-file_handler.setFormatter(file_formatter)
 
-# Create console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter(
-    "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
-console_handler.setFormatter(console_formatter)
-
-# Configure root logger
+# Configure root logger, once: re-importing this module must not stack
+# duplicate handlers.
 root_logger = logging.getLogger()
-root_logger.setLevel(logging.INFO)
-root_logger.addHandler(file_handler)
-root_logger.addHandler(console_handler)
-
-logger.info(f"Logging to console and file: {log_file}")
+if not root_logger.handlers:
+    # Create file handler
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(log_formatter)
+
+    # Create console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(log_formatter)
+
+    # Callers only enqueue records; a listener thread does the file and
+    # console I/O, so logging never blocks the event loop.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(logging.INFO)
+    log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+
+    logger.info("Logging to console and file: %s", log_file)
 
 
 DEFAULT_SAMPLE_RATE = 48_000
 DEFAULT_BLOCK_SIZE = 1_024
 DEFAULT_CONFIG_PATH = "configs/simple_routing.yaml"
+# Most snapshots coalesced into one WebSocket message when the broadcaster
+# has a backlog.
+BROADCAST_BATCH = max(1, int(os.getenv("AERS_BROADCAST_BATCH", "4")))
 
 # Directory for uploaded audio files
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
 
-app = FastAPI(title="AERS Metrics Server", version="0.1.0")
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (C encoder, native numpy support)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json_bytes(content: Any) -> Response:
+    """
+    Encode `content` with orjson into a plain Response.
+
+    Handlers that return this skip FastAPI's jsonable_encoder and
+    response-model validation passes entirely.
+    """
+    return Response(
+        orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+    )
+
+
+app = FastAPI(
+    title="AERS Metrics Server",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Allow local dev UI (file://, localhost) to connect
 app.add_middleware(
@@ -80,113 +123,274 @@ _simulation_task: Optional[asyncio.Task] = None
 _frame_index: int = 0
 # Current engine and config (for dynamic updates)
 _current_engine: Optional[GraphEngine] = None
-_current_config_path: str = DEFAULT_CONFIG_PATH
-
+# YAML the running config came from; None while running an uploaded
+# config, which only exists in memory (_current_routing_config)
+_current_config_path: Optional[str] = DEFAULT_CONFIG_PATH
+_current_routing_config: Optional[RoutingConfig] = None
+# (path, parsed config) of the last routing config file loaded, so edits
+# and uploads do not re-read the YAML the simulation loop already parsed
+_routing_config_cache: Optional[Tuple[str, RoutingConfig]] = None
+# Uploaded audio by file id, so /api/audio lookups skip a directory scan
+_audio_index: Dict[str, Path] = {}
+# Single dedicated thread for engine construction and block processing, so
+# NumPy DSP never runs on the event loop and node state stays single-threaded.
+_dsp_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aers-dsp")
+
+
+async def _broadcast_snapshots(snapshots: List[MetricsSnapshot], send_timeout: float) -> None:
+    """
+    Send a batch of metrics snapshots to all connected WebSocket clients.
 
-async def _broadcast_snapshot(snapshot: MetricsSnapshot) -> None:
-    """Send a metrics snapshot to all connected WebSocket clients."""
+    A client whose send does not complete within `send_timeout` seconds is
+    dropped and its socket closed (1013, try again later) so the dashboard
+    notices and reconnects; clients whose send fails are dropped as well.
+    """
     if not _metrics_clients:
         return
 
-    data = snapshot.to_dict()
-    disconnected: Set[WebSocket] = set()
+    # Encode once for all clients and send the UTF-8 bytes as a binary frame,
+    # skipping the str round trip.
+    payload = encode_batch(snapshots)
+    clients = list(_metrics_clients)
+
+    # Send to every client concurrently, so one slow socket does not hold up
+    # the rest. Any failure (timeout, disconnect or otherwise) drops that client.
+    results = await asyncio.gather(
+        *(asyncio.wait_for(ws.send_bytes(payload), send_timeout) for ws in clients),
+        return_exceptions=True,
+    )
+    for ws, result in zip(clients, results):
+        if isinstance(result, BaseException):
+            _metrics_clients.discard(ws)
+            if isinstance(result, asyncio.TimeoutError):
+                # Close in the background: the socket is already slow, and
+                # the next broadcast must not wait on it.
+                task = asyncio.create_task(_close_quietly(ws, code=1013))
+                _closing_tasks.add(task)
+                task.add_done_callback(_closing_tasks.discard)
+
+
+# Background closes of dropped clients (held so they are not collected early)
+_closing_tasks: Set[asyncio.Task] = set()
+# Upper bound on closing a dropped client's socket
+_CLOSE_TIMEOUT = 1.0
+
+
+async def _close_quietly(ws: WebSocket, code: int) -> None:
+    """Close `ws`, ignoring errors from a socket that is already broken."""
+    try:
+        await asyncio.wait_for(ws.close(code=code), _CLOSE_TIMEOUT)
+    except Exception as e:
+        logger.debug("Could not close dropped client: %s", e)
+
+
+# Snapshots buffered between the DSP producer and the broadcaster (~85 ms at
+# 1024 frames / 48 kHz). When full, the oldest snapshot is dropped.
+_SNAPSHOT_QUEUE_SIZE = 4
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    """Enqueue `item`, evicting the oldest entry if the queue is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
 
-    for ws in list(_metrics_clients):
+async def _broadcast_worker(queue: asyncio.Queue, send_timeout: float) -> None:
+    """
+    Consume snapshots from `queue` and broadcast them in FIFO order.
+
+    Snapshots already waiting are sent together, up to BROADCAST_BATCH per
+    message; the worker never waits to fill a batch.
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < BROADCAST_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
         try:
-            await ws.send_json(data)
-        except WebSocketDisconnect:
-            disconnected.add(ws)
-        except Exception:
-            # Any unexpected error: drop the client quietly
-            disconnected.add(ws)
+            await _broadcast_snapshots(batch, send_timeout)
+        except Exception as e:
+            logger.error("❌ Error broadcasting snapshot: %s", e, exc_info=True)
+
+
+def _load_config_cached(config_path: str) -> RoutingConfig:
+    """Load `config_path`, reusing the parsed config if it was the last one loaded."""
+    global _routing_config_cache
+    cached = _routing_config_cache
+    if cached is not None and cached[0] == config_path:
+        return cached[1]
+    routing_config = load_routing_config(config_path)
+    _routing_config_cache = (config_path, routing_config)
+    return routing_config
+
+
+def _current_config() -> RoutingConfig:
+    """The current routing config: from its YAML file, else the uploaded in-memory one."""
+    if _current_config_path is not None:
+        return _load_config_cached(_current_config_path)
+    if _current_routing_config is None:
+        raise RuntimeError("No routing config is loaded")
+    return _current_routing_config
+
+
+def _graph_edit_path() -> Path:
+    """Fresh path for a graph edit's YAML, next to the current config file."""
+    base_dir = Path(_current_config_path).parent if _current_config_path else UPLOAD_DIR
+    return base_dir / f"graph_edit_{uuid.uuid4().hex[:8]}.yaml"
+
+
+def _build_engine(routing_config: RoutingConfig) -> GraphEngine:
+    """Instantiate a GraphEngine for a routing config (runs on the DSP thread)."""
+    return GraphEngine(
+        sample_rate=routing_config.sample_rate,
+        frame_size=routing_config.frame_size,
+        node_specs=routing_config.node_specs,
+        connections=routing_config.connections,
+        default_channels=2,
+        node_positions=routing_config.node_positions,
+    )
+
+
+def _file_info_sources(engine: GraphEngine) -> Dict[str, Callable[[], Dict[str, Any]]]:
+    """Map each node that reports file metadata (AudioFileSourceNode) to its getter."""
+    return {
+        name: node.get_file_info
+        for name, node in engine.nodes.items()
+        if hasattr(node, "get_file_info")
+    }
 
-    for ws in disconnected:
-        _metrics_clients.discard(ws)
+
+def _process_block(
+    engine: GraphEngine,
+    frame_index: int,
+    file_info_sources: Dict[str, Callable[[], Dict[str, Any]]],
+) -> MetricsSnapshot:
+    """
+    Process one block and reduce it to a metrics snapshot (runs on the DSP thread).
+
+    Metrics are computed here, before returning, because frame data lives in
+    the engine's reusable buffers and is overwritten by later blocks.
+    `file_info_sources` comes from _file_info_sources(engine).
+    """
+    outputs = engine.process_frame(frame_index)
+
+    now = time.time()
+    node_metrics = frames_to_metrics(outputs)
+    if not file_info_sources:
+        return MetricsSnapshot(timestamp=now, nodes=node_metrics)
+
+    # Add file info for AudioFileSourceNodes
+    get_source = file_info_sources.get
+    for i, metric in enumerate(node_metrics):
+        get_file_info = get_source(metric.name)
+        if get_file_info is not None:
+            try:
+                node_metrics[i] = dataclasses.replace(metric, file_info=get_file_info())
+            except Exception as e:
+                logger.debug("Could not get file info for %s: %s", metric.name, e)
+    return MetricsSnapshot(timestamp=now, nodes=node_metrics)
 
 
 async def _simulation_loop(
-    config_path: str,
+    config_path: Optional[str],
     block_size: int = DEFAULT_BLOCK_SIZE,
     sample_rate: int = DEFAULT_SAMPLE_RATE,
+    routing_config: Optional[RoutingConfig] = None,
 ) -> None:
     """
     Background simulation loop.
 
-    - Loads routing config
+    - Loads routing config from `config_path`, or uses `routing_config`,
+      built in memory (config_path is then None)
     - Instantiates GraphEngine
-    - Continuously processes blocks
-    - Broadcasts node metrics over WebSocket to all subscribers
+    - Continuously processes blocks on the DSP thread
+    - Hands snapshots through a bounded queue to a broadcaster task, which
+      sends node metrics over WebSocket to all subscribers
     """
-    global _frame_index, _current_engine, _current_config_path
+    global _frame_index, _current_engine, _current_config_path, _current_routing_config
+
+    loop = asyncio.get_running_loop()
+    broadcaster: Optional[asyncio.Task] = None
 
     try:
-        logger.info(f"🔄 Loading config: {config_path}")
-        routing_config = load_routing_config(config_path)
-        logger.info(f"✅ Config loaded: {len(routing_config.node_specs)} nodes, {len(routing_config.connections)} connections")
-        
-        engine = GraphEngine(
-            sample_rate=routing_config.sample_rate,
-            frame_size=routing_config.frame_size,
-            node_specs=routing_config.node_specs,
-            connections=routing_config.connections,
-            default_channels=2,
-            node_positions=routing_config.node_positions,
+        if routing_config is None:
+            if config_path is None:
+                raise ValueError("Either config_path or routing_config is required")
+            logger.info("🔄 Loading config: %s", config_path)
+            routing_config = _load_config_cached(config_path)
+        logger.info(
+            "✅ Config loaded: %d nodes, %d connections",
+            len(routing_config.node_specs), len(routing_config.connections),
         )
         
-        logger.info(f"✅ Engine created: {list(engine.nodes.keys())}")
+        # Node construction can decode and resample audio files; keep it off the loop.
+        engine = await loop.run_in_executor(_dsp_executor, _build_engine, routing_config)
+        
+        logger.info("✅ Engine created: %s", list(engine.nodes.keys()))
         
         _current_engine = engine
         _current_config_path = config_path
+        _current_routing_config = routing_config if config_path is None else None
+        file_info_sources = _file_info_sources(engine)
 
         # Use actual frame_size from config
         actual_block_size = routing_config.frame_size
         block_duration = actual_block_size / float(routing_config.sample_rate)
 
+        # Clients get two blocks' worth of time per send before being dropped.
+        snapshot_queue: asyncio.Queue = asyncio.Queue(maxsize=_SNAPSHOT_QUEUE_SIZE)
+        broadcaster = asyncio.create_task(
+            _broadcast_worker(snapshot_queue, send_timeout=2 * block_duration)
+        )
+
         _frame_index = 0
-        logger.info(f"🔄 Starting simulation loop (block_size={actual_block_size}, duration={block_duration:.4f}s)")
+        logger.info(
+            "🔄 Starting simulation loop (block_size=%d, duration=%.4fs)",
+            actual_block_size, block_duration,
+        )
 
+        # Bind the per-block callables once rather than looking them up as
+        # globals/attributes on every iteration.
+        run_in_executor = loop.run_in_executor
+        dsp_executor = _dsp_executor
+        process_block = _process_block
+        put_latest = _put_latest
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+
+        # Pace against absolute deadlines so processing time and sleep jitter
+        # do not accumulate into drift.
+        next_deadline = monotonic()
         while True:
             try:
                 # Process one block of audio through the routing graph
-                outputs = engine.process_frame(_frame_index)
-
-                now = time.time()
-                node_metrics = []
-                for node_name, frame in outputs.items():
-                    metric = frame_to_metrics(name=node_name, frame=frame)
-                    # Add file info if this is an AudioFileSourceNode
-                    node = engine.nodes.get(node_name)
-                    if node and hasattr(node, 'get_file_info'):
-                        try:
-                            file_info = node.get_file_info()
-                            # Create new metric with file_info
-                            from aers.ui.metrics import NodeMetric
-                            metric = NodeMetric(
-                                name=metric.name,
-                                peak=metric.peak,
-                                rms=metric.rms,
-                                num_frames=metric.num_frames,
-                                num_channels=metric.num_channels,
-                                file_info=file_info,
-                            )
-                        except Exception as e:
-                            logger.debug(f"Could not get file info for {node_name}: {e}")
-                    node_metrics.append(metric)
-                snapshot = MetricsSnapshot(timestamp=now, nodes=node_metrics)
-
-                await _broadcast_snapshot(snapshot)
+                snapshot = await run_in_executor(
+                    dsp_executor, process_block, engine, _frame_index, file_info_sources
+                )
+
+                # Slow clients hold up the broadcaster, never block processing.
+                put_latest(snapshot_queue, snapshot)
                 
                 _frame_index += 1
-                # Sleep to approximate real-time behavior
-                await asyncio.sleep(block_duration)
+                next_deadline += block_duration
+                delay = next_deadline - monotonic()
+                if delay > 0:
+                    await sleep(delay)
+                else:
+                    # Fell behind: restart the schedule instead of bursting to catch up
+                    next_deadline = monotonic()
             except Exception as e:
-                logger.error(f"❌ Error in simulation loop iteration: {e}", exc_info=True)
+                logger.error("❌ Error in simulation loop iteration: %s", e, exc_info=True)
                 # Continue running despite errors
                 await asyncio.sleep(0.1)
+                next_deadline = time.monotonic()
     except Exception as e:
-        logger.error(f"❌ Fatal error in simulation loop: {e}", exc_info=True)
+        logger.error("❌ Fatal error in simulation loop: %s", e, exc_info=True)
         # Re-raise so the task is marked as done and can be restarted
         raise
+    finally:
+        if broadcaster is not None:
+            broadcaster.cancel()
 
 
 @app.on_event("startup")
@@ -217,11 +421,17 @@ async def metrics_websocket(websocket: WebSocket) -> None:
     """
     WebSocket endpoint for real-time metrics.
 
-    Clients connect and receive JSON snapshots in the shape:
+    Clients connect and receive batches of one or more JSON snapshots
+    (UTF-8, sent as binary frames), oldest first, in the shape:
     {
-      "timestamp": 1712345678.123,
-      "nodes": [
-        {"name": "source1", "peak": 0.2, "rms": 0.14, "num_frames": 1024, "num_channels": 2},
+      "batch": [
+        {
+          "timestamp": 1712345678.123,
+          "nodes": [
+            {"name": "source1", "peak": 0.2, "rms": 0.14, "num_frames": 1024, "num_channels": 2},
+            ...
+          ]
+        },
         ...
       ]
     }
@@ -231,28 +441,35 @@ async def metrics_websocket(websocket: WebSocket) -> None:
 
     try:
         # Keep the connection open. We don't require incoming messages,
-        # but we must read to honor WebSocket semantics.
-        while True:
-            try:
-                await websocket.receive_text()
-            except WebSocketDisconnect:
-                break
-            except Exception:
-                # Ignore malformed client messages; we are push-only.
-                await asyncio.sleep(0.1)
+        # but we must read to honor WebSocket semantics. Raw receive() takes
+        # text and binary alike, so client messages (we are push-only) are
+        # discarded without an exception path, and the loop idles until the
+        # disconnect message arrives.
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     finally:
         _metrics_clients.discard(websocket)
 
 
+# Copy buffer for saving uploads
+_UPLOAD_CHUNK = 1 << 20
+
+
+def _save_upload(src: Any, dest: Path) -> None:
+    """Copy an uploaded file object to `dest` in 1 MiB chunks (blocking)."""
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(src, f, _UPLOAD_CHUNK)
+
+
 @app.post("/api/upload-audio")
-async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
+async def upload_audio(file: UploadFile = File(...)) -> Response:
     """
     Upload an audio file and update routing to use it.
     
     The uploaded file will be saved and a new routing config will be created
     that uses the uploaded file as an audio_file source node.
     """
-    global _simulation_task, _current_config_path
+    global _simulation_task, _current_config_path, _current_routing_config
     
     # Validate file type
     allowed_extensions = {'.wav', '.flac', '.mp3', '.ogg', '.m4a', '.aac'}
@@ -269,14 +486,15 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
     saved_path = UPLOAD_DIR / saved_filename
     
     try:
-        # Save uploaded file
-        with open(saved_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+        # Save uploaded file on a worker thread so a large upload does not
+        # stall the event loop (and with it the metrics broadcast).
+        await asyncio.to_thread(_save_upload, file.file, saved_path)
+        _audio_index[file_id] = saved_path
         
         # Create a dynamic config that uses the uploaded file
         # Find the first source node and replace it, or add a new one
         try:
-            current_config = load_routing_config(_current_config_path)
+            current_config = _current_config()
             
             # Create new node specs with uploaded file
             new_node_specs = []
@@ -285,8 +503,8 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
             first_source_id = None
             
             for node_spec in current_config.node_specs:
-                node_kind = node_spec.get("kind", "")
-                node_id = node_spec.get("id", "")
+                node_kind = node_spec.kind
+                node_id = node_spec.id
                 
                 # Track first source node
                 if node_kind in ("sine", "audio_file") and first_source_id is None:
@@ -294,15 +512,15 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
                 
                 # Replace first sine source with audio_file
                 if node_kind == "sine" and not file_source_added:
-                    new_node_specs.append({
-                        "id": node_id,
-                        "kind": "audio_file",
-                        "params": {
+                    new_node_specs.append(NodeSpec(
+                        id=node_id,
+                        kind="audio_file",
+                        params={
                             "file_path": str(saved_path.absolute()),
                             "loop": True,
-                            "channels": node_spec.get("params", {}).get("channels", 2),
-                        }
-                    })
+                            "channels": node_spec.params.get("channels", 2),
+                        },
+                    ))
                     file_source_added = True
                     source_id = node_id
                 else:
@@ -311,18 +529,17 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
             # If no sine source found, add audio_file as first node
             if not file_source_added:
                 source_id = "uploaded_audio"
-                new_node_specs.insert(0, {
-                    "id": source_id,
-                    "kind": "audio_file",
-                    "params": {
+                new_node_specs.insert(0, NodeSpec(
+                    id=source_id,
+                    kind="audio_file",
+                    params={
                         "file_path": str(saved_path.absolute()),
                         "loop": True,
                         "channels": 2,
-                    }
-                })
+                    },
+                ))
                 # Update connections: if first source was connected, connect new source to same destination
                 if first_source_id:
-                    from aers.core.graph_engine import Connection
                     new_connections = []
                     for conn in current_config.connections:
                         if conn.src == first_source_id:
@@ -331,28 +548,19 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
                             new_connections.append(conn)
                 else:
                     # No existing connections, use existing ones
-                    new_connections = current_config.connections
+                    new_connections = list(current_config.connections)
             else:
                 # Use existing connections
-                new_connections = current_config.connections
-            
-            # Create temporary config file
-            import yaml
-            temp_config_path = UPLOAD_DIR / f"config_{file_id}.yaml"
+                new_connections = list(current_config.connections)
             
-            # Convert Connection objects to dicts for YAML serialization
-            connections_dict = [
-                {"from": conn.src, "to": conn.dst}
-                for conn in new_connections
-            ]
-            
-            with open(temp_config_path, "w") as f:
-                yaml.dump({
-                    "sample_rate": current_config.sample_rate,
-                    "frame_size": current_config.frame_size,
-                    "nodes": new_node_specs,
-                    "connections": connections_dict,
-                }, f)
+            # Hand the new config to the loop directly rather than writing
+            # it out as YAML only to parse it back; it has no config path.
+            new_config = RoutingConfig.from_specs(
+                sample_rate=current_config.sample_rate,
+                frame_size=current_config.frame_size,
+                node_specs=new_node_specs,
+                connections=new_connections,
+            )
             
             # Restart simulation with new config
             if _simulation_task:
@@ -365,15 +573,18 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
                 await asyncio.sleep(0.1)
             
             _simulation_task = asyncio.create_task(
-                _simulation_loop(config_path=str(temp_config_path))
+                _simulation_loop(config_path=None, routing_config=new_config)
             )
+            # Track it right away, as graph edits do, so a follow-up edit
+            # builds on this config even before the loop has started.
+            _current_config_path = None
+            _current_routing_config = new_config
             
             logger.info(f"✅ Audio uploaded: {file.filename}")
-            logger.info(f"   Config: {temp_config_path}")
             logger.info(f"   Source node: {source_id}")
-            logger.info(f"   Nodes: {[n.get('id') for n in new_node_specs]}")
+            logger.info(f"   Nodes: {[n.id for n in new_node_specs]}")
             
-            return JSONResponse({
+            return _json_bytes({
                 "success": True,
                 "message": f"Audio file uploaded and routing updated",
                 "filename": file.filename,
@@ -384,31 +595,49 @@ async def upload_audio(file: UploadFile = File(...)) -> JSONResponse:
             
         except Exception as e:
             # Clean up on error
+            _audio_index.pop(file_id, None)
             if saved_path.exists():
                 saved_path.unlink()
             raise HTTPException(status_code=500, detail=f"Failed to update routing: {e}")
             
     except Exception as e:
+        _audio_index.pop(file_id, None)
         if saved_path.exists():
             saved_path.unlink()
         raise HTTPException(status_code=500, detail=f"Upload failed: {e}")
 
 
+_AUDIO_MEDIA_TYPES = {
+    ".wav": "audio/wav",
+    ".flac": "audio/flac",
+    ".mp3": "audio/mpeg",
+    ".ogg": "audio/ogg",
+    ".m4a": "audio/mp4",
+    ".aac": "audio/aac",
+}
+
+
 @app.get("/api/audio/{file_id}")
 async def get_audio_file(file_id: str):
     """Serve an uploaded audio file."""
-    # Find the file by ID (files are named with UUID)
-    for file_path in UPLOAD_DIR.glob(f"{file_id}.*"):
-        if file_path.is_file():
-            return FileResponse(
-                path=str(file_path),
-                media_type="audio/mpeg" if file_path.suffix == ".mp3" else "audio/wav",
-            )
-    raise HTTPException(status_code=404, detail="Audio file not found")
+    file_path = _audio_index.get(file_id)
+    if file_path is None:
+        # Not uploaded by this process (e.g. before a restart): find the
+        # file by ID (files are named with UUID) and remember it.
+        for candidate in UPLOAD_DIR.glob(f"{file_id}.*"):
+            if candidate.suffix.lower() in _AUDIO_MEDIA_TYPES and candidate.is_file():
+                file_path = _audio_index[file_id] = candidate
+                break
+    if file_path is None or not file_path.is_file():
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return FileResponse(
+        path=str(file_path),
+        media_type=_AUDIO_MEDIA_TYPES.get(file_path.suffix.lower(), "application/octet-stream"),
+    )
 
 
-@app.get("/api/status")
-async def get_status() -> JSONResponse:
+@app.get("/api/status", response_model=None)
+async def get_status() -> Response:
     """Get current server status and routing info."""
     global _current_engine, _current_config_path
     
@@ -419,23 +648,23 @@ async def get_status() -> JSONResponse:
         "connected_clients": len(_metrics_clients),
     }
     
-    return JSONResponse(status)
+    return _json_bytes(status)
 
 
 # Graph Editor API Endpoints
 @app.get("/api/graph/current")
-async def get_current_graph() -> JSONResponse:
+async def get_current_graph() -> Dict[str, Any]:
     """Get current graph state with positions for visualization."""
     global _current_engine
     if not _current_engine:
-        return JSONResponse({"nodes": [], "connections": [], "layout_version": 0})
-    return JSONResponse(_current_engine.get_graph_state())
+        return {"nodes": [], "connections": [], "layout_version": 0}
+    return _current_engine.get_graph_state()
 
 
 @app.post("/api/graph/nodes")
 async def add_node(request: Request) -> JSONResponse:
     """Add a new node to the graph."""
-    global _simulation_task, _current_config_path, _current_engine
+    global _simulation_task, _current_config_path, _current_routing_config, _current_engine
     
     try:
         data = await request.json()
@@ -449,39 +678,32 @@ async def add_node(request: Request) -> JSONResponse:
             raise HTTPException(400, "Missing 'id' or 'kind'")
         
         # Load current config
-        current_config = load_routing_config(_current_config_path)
+        current_config = _current_config()
         
         # Check if node already exists
-        existing_ids = {n.get("id") for n in current_config.node_specs}
+        existing_ids = {n.id for n in current_config.node_specs}
         if node_id in existing_ids:
             raise HTTPException(400, f"Node '{node_id}' already exists")
         
         # Add new node spec
-        new_node_spec = {
+        new_node_spec = NodeSpec.from_dict({
             "id": node_id,
             "kind": node_kind,
             "params": params,
             "position": {"x": x, "y": y},
-        }
+        })
         
         new_node_specs = list(current_config.node_specs) + [new_node_spec]
         
         # Save updated config
-        import yaml
-        temp_config_path = Path(_current_config_path).parent / f"graph_edit_{uuid.uuid4().hex[:8]}.yaml"
-        
-        connections_dict = [
-            {"from": conn.src, "to": conn.dst}
-            for conn in current_config.connections
-        ]
-        
-        with open(temp_config_path, "w") as f:
-            yaml.dump({
-                "sample_rate": current_config.sample_rate,
-                "frame_size": current_config.frame_size,
-                "nodes": new_node_specs,
-                "connections": connections_dict,
-            }, f)
+        temp_config_path = _graph_edit_path()
+        write_routing_config(
+            temp_config_path,
+            sample_rate=current_config.sample_rate,
+            frame_size=current_config.frame_size,
+            node_specs=new_node_specs,
+            connections=current_config.connections,
+        )
         
         # Restart simulation
         if _simulation_task:
@@ -496,6 +718,7 @@ async def add_node(request: Request) -> JSONResponse:
             _simulation_loop(config_path=str(temp_config_path))
         )
         _current_config_path = str(temp_config_path)
+        _current_routing_config = None
         
         logger.info(f"✅ Node added: {node_id} ({node_kind})")
         
@@ -508,13 +731,13 @@ async def add_node(request: Request) -> JSONResponse:
 @app.delete("/api/graph/nodes/{node_id}")
 async def remove_node(node_id: str) -> JSONResponse:
     """Remove a node from the graph."""
-    global _simulation_task, _current_config_path
+    global _simulation_task, _current_config_path, _current_routing_config
     
     try:
-        current_config = load_routing_config(_current_config_path)
+        current_config = _current_config()
         
         # Remove node
-        new_node_specs = [n for n in current_config.node_specs if n.get("id") != node_id]
+        new_node_specs = [n for n in current_config.node_specs if n.id != node_id]
         
         if len(new_node_specs) == len(current_config.node_specs):
             raise HTTPException(404, f"Node '{node_id}' not found")
@@ -526,21 +749,14 @@ async def remove_node(node_id: str) -> JSONResponse:
         ]
         
         # Save updated config
-        import yaml
-        temp_config_path = Path(_current_config_path).parent / f"graph_edit_{uuid.uuid4().hex[:8]}.yaml"
-        
-        connections_dict = [
-            {"from": conn.src, "to": conn.dst}
-            for conn in new_connections
-        ]
-        
-        with open(temp_config_path, "w") as f:
-            yaml.dump({
-                "sample_rate": current_config.sample_rate,
-                "frame_size": current_config.frame_size,
-                "nodes": new_node_specs,
-                "connections": connections_dict,
-            }, f)
+        temp_config_path = _graph_edit_path()
+        write_routing_config(
+            temp_config_path,
+            sample_rate=current_config.sample_rate,
+            frame_size=current_config.frame_size,
+            node_specs=new_node_specs,
+            connections=new_connections,
+        )
         
         # Restart simulation
         if _simulation_task:
@@ -555,6 +771,7 @@ async def remove_node(node_id: str) -> JSONResponse:
             _simulation_loop(config_path=str(temp_config_path))
         )
         _current_config_path = str(temp_config_path)
+        _current_routing_config = None
         
         logger.info(f"✅ Node removed: {node_id}")
         
@@ -569,7 +786,7 @@ async def remove_node(node_id: str) -> JSONResponse:
 @app.post("/api/graph/connections")
 async def add_connection(request: Request) -> JSONResponse:
     """Add a connection between nodes."""
-    global _simulation_task, _current_config_path
+    global _simulation_task, _current_config_path, _current_routing_config
     
     try:
         data = await request.json()
@@ -582,17 +799,16 @@ async def add_connection(request: Request) -> JSONResponse:
         if src == dst:
             raise HTTPException(400, "Cannot connect node to itself")
         
-        current_config = load_routing_config(_current_config_path)
+        current_config = _current_config()
         
         # Check nodes exist
-        node_ids = {n.get("id") for n in current_config.node_specs}
+        node_ids = {n.id for n in current_config.node_specs}
         if src not in node_ids:
             raise HTTPException(404, f"Source node '{src}' not found")
         if dst not in node_ids:
             raise HTTPException(404, f"Destination node '{dst}' not found")
         
         # Check connection doesn't already exist
-        from aers.core.graph_engine import Connection
         new_conn = Connection(src=src, dst=dst)
         if new_conn in current_config.connections:
             raise HTTPException(400, "Connection already exists")
@@ -601,21 +817,14 @@ async def add_connection(request: Request) -> JSONResponse:
         new_connections = list(current_config.connections) + [new_conn]
         
         # Save updated config
-        import yaml
-        temp_config_path = Path(_current_config_path).parent / f"graph_edit_{uuid.uuid4().hex[:8]}.yaml"
-        
-        connections_dict = [
-            {"from": conn.src, "to": conn.dst}
-            for conn in new_connections
-        ]
-        
-        with open(temp_config_path, "w") as f:
-            yaml.dump({
-                "sample_rate": current_config.sample_rate,
-                "frame_size": current_config.frame_size,
-                "nodes": current_config.node_specs,
-                "connections": connections_dict,
-            }, f)
+        temp_config_path = _graph_edit_path()
+        write_routing_config(
+            temp_config_path,
+            sample_rate=current_config.sample_rate,
+            frame_size=current_config.frame_size,
+            node_specs=current_config.node_specs,
+            connections=new_connections,
+        )
         
         # Restart simulation (will validate DAG)
         if _simulation_task:
@@ -630,6 +839,7 @@ async def add_connection(request: Request) -> JSONResponse:
             _simulation_loop(config_path=str(temp_config_path))
         )
         _current_config_path = str(temp_config_path)
+        _current_routing_config = None
         
         logger.info(f"✅ Connection added: {src} -> {dst}")
         
@@ -647,7 +857,7 @@ async def add_connection(request: Request) -> JSONResponse:
 @app.delete("/api/graph/connections")
 async def remove_connection(request: Request) -> JSONResponse:
     """Remove a connection."""
-    global _simulation_task, _current_config_path
+    global _simulation_task, _current_config_path, _current_routing_config
     
     try:
         data = await request.json()
@@ -657,9 +867,8 @@ async def remove_connection(request: Request) -> JSONResponse:
         if not src or not dst:
             raise HTTPException(400, "Missing 'from' or 'to'")
         
-        current_config = load_routing_config(_current_config_path)
+        current_config = _current_config()
         
-        from aers.core.graph_engine import Connection
         target_conn = Connection(src=src, dst=dst)
         
         if target_conn not in current_config.connections:
@@ -668,21 +877,14 @@ async def remove_connection(request: Request) -> JSONResponse:
         new_connections = [c for c in current_config.connections if c != target_conn]
         
         # Save updated config
-        import yaml
-        temp_config_path = Path(_current_config_path).parent / f"graph_edit_{uuid.uuid4().hex[:8]}.yaml"
-        
-        connections_dict = [
-            {"from": conn.src, "to": conn.dst}
-            for conn in new_connections
-        ]
-        
-        with open(temp_config_path, "w") as f:
-            yaml.dump({
-                "sample_rate": current_config.sample_rate,
-                "frame_size": current_config.frame_size,
-                "nodes": current_config.node_specs,
-                "connections": connections_dict,
-            }, f)
+        temp_config_path = _graph_edit_path()
+        write_routing_config(
+            temp_config_path,
+            sample_rate=current_config.sample_rate,
+            frame_size=current_config.frame_size,
+            node_specs=current_config.node_specs,
+            connections=new_connections,
+        )
         
         # Restart simulation
         if _simulation_task:
@@ -697,6 +899,7 @@ async def remove_connection(request: Request) -> JSONResponse:
             _simulation_loop(config_path=str(temp_config_path))
         )
         _current_config_path = str(temp_config_path)
+        _current_routing_config = None
         
         logger.info(f"✅ Connection removed: {src} -> {dst}")
         
@@ -1,21 +1,47 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
-from typing import List, Any, Dict, Tuple
+from typing import Dict, Iterable, Tuple
 
 import yaml
 
-from aers.core.graph_engine import Connection
+from aers.core.graph_engine import Connection, NodeSpec
 
+# libyaml's C loader/dumper when PyYAML was built with it; the pure-Python
+# ones otherwise. Output is the same either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RoutingConfig:
     sample_rate: int
     frame_size: int
-    node_specs: List[Dict[str, Any]]
-    connections: List[Connection]
+    node_specs: Tuple[NodeSpec, ...]
+    connections: Tuple[Connection, ...]
     node_positions: Dict[str, Tuple[float, float]] = field(default_factory=dict)
 
+    @classmethod
+    def from_specs(
+        cls,
+        sample_rate: int,
+        frame_size: int,
+        node_specs: Iterable[NodeSpec],
+        connections: Iterable[Connection],
+    ) -> "RoutingConfig":
+        """Build a config in memory, taking node positions from the specs."""
+        node_specs = tuple(node_specs)
+        return cls(
+            sample_rate=sample_rate,
+            frame_size=frame_size,
+            node_specs=node_specs,
+            connections=tuple(connections),
+            node_positions={
+                spec.id: spec.position for spec in node_specs if spec.position is not None
+            },
+        )
+
 
 def load_routing_config(path: str) -> RoutingConfig:
     """
@@ -40,7 +66,7 @@ def load_routing_config(path: str) -> RoutingConfig:
             to: bus_main
     """
     with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YAML_LOADER)
 
     if not isinstance(raw, dict):
         raise ValueError(f"Config at {path} must be a mapping")
@@ -48,15 +74,16 @@ def load_routing_config(path: str) -> RoutingConfig:
     sample_rate = int(raw.get("sample_rate", 48000))
     frame_size = int(raw.get("frame_size", 1024))
 
-    node_specs = raw.get("nodes", [])
-    if not isinstance(node_specs, list):
+    raw_nodes = raw.get("nodes", [])
+    if not isinstance(raw_nodes, list):
         raise ValueError("Config 'nodes' must be a list")
+    node_specs = tuple(NodeSpec.from_dict(n) for n in raw_nodes)
 
     raw_conns = raw.get("connections", [])
     if not isinstance(raw_conns, list):
         raise ValueError("Config 'connections' must be a list")
 
-    connections: List[Connection] = []
+    connections = []
     for c in raw_conns:
         try:
             src = c["from"]
@@ -64,23 +91,29 @@ def load_routing_config(path: str) -> RoutingConfig:
         except KeyError as e:
             raise ValueError(f"Connection entry missing key: {e}") from e
         connections.append(Connection(src=src, dst=dst))
-    
-    # Load node positions if present
-    node_positions: Dict[str, Tuple[float, float]] = {}
-    for node_spec in node_specs:
-        node_id = node_spec.get("id")
-        if node_id and "position" in node_spec:
-            pos = node_spec["position"]
-            if isinstance(pos, dict):
-                node_positions[node_id] = (float(pos.get("x", 0)), float(pos.get("y", 0)))
-            elif isinstance(pos, (list, tuple)) and len(pos) >= 2:
-                node_positions[node_id] = (float(pos[0]), float(pos[1]))
-
-    return RoutingConfig(
+
+    return RoutingConfig.from_specs(
         sample_rate=sample_rate,
         frame_size=frame_size,
         node_specs=node_specs,
         connections=connections,
-        node_positions=node_positions,
     )
 
+
+def write_routing_config(
+    path: str | os.PathLike[str],
+    *,
+    sample_rate: int,
+    frame_size: int,
+    node_specs: Iterable[NodeSpec],
+    connections: Iterable[Connection],
+) -> None:
+    """Write a routing configuration as YAML readable by load_routing_config."""
+    data = {
+        "sample_rate": sample_rate,
+        "frame_size": frame_size,
+        "nodes": [spec.to_dict() for spec in node_specs],
+        "connections": [{"from": conn.src, "to": conn.dst} for conn in connections],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f, Dumper=_YAML_DUMPER)
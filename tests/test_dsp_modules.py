@@ -1,8 +1,10 @@
 # tests/test_dsp_modules.py
 
 import numpy as np
+import pytest
+from scipy import signal
 
-from aers.core.nodes import AudioFrame, GainNode, EQNode, DelayNode
+from aers.core.nodes import AudioFileSourceNode, AudioFrame, GainNode, EQNode, DelayNode
 
 
 def _make_constant_frame(
@@ -61,6 +63,38 @@ def test_eq_node_boosts_highs():
     assert out_rms > in_rms
 
 
+def test_eq_node_state_carries_across_blocks():
+    rng = np.random.default_rng(1)
+    data = rng.normal(0.0, 0.2, size=(1024, 2)).astype(np.float32)
+    config = {"low_gain_db": -3.0, "mid_gain_db": 2.0, "high_gain_db": 6.0}
+
+    whole = EQNode(name="eq_whole", sample_rate=48_000, channels=2, config=config)
+    expected = whole.process(
+        num_frames=1024, timestamp=0.0,
+        inputs=[AudioFrame(data=data, sample_rate=48_000, timestamp=0.0)],
+    ).data.copy()
+
+    split = EQNode(name="eq_split", sample_rate=48_000, channels=2, config=config)
+    blocks = [
+        split.process(
+            num_frames=256, timestamp=0.0,
+            inputs=[AudioFrame(data=data[i:i + 256], sample_rate=48_000, timestamp=0.0)],
+        ).data.copy()
+        for i in range(0, 1024, 256)
+    ]
+
+    np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1e-6)
+
+
+def test_eq_node_set_band_gains_matches_fresh_design():
+    gains = {"low_gain_db": -4.0, "mid_gain_db": 1.0, "high_gain_db": 5.0}
+    eq = EQNode(name="eq_auto", sample_rate=48_000, channels=1)
+    eq.set_band_gains_db(gains["low_gain_db"], gains["mid_gain_db"], gains["high_gain_db"])
+
+    fresh = EQNode(name="eq_fresh", sample_rate=48_000, channels=1, config=gains)
+    np.testing.assert_allclose(eq._sos, fresh._sos)
+
+
 def test_delay_node_inserts_delayed_impulse():
     sample_rate = 48_000
     num_frames = 480  # 10 ms frame
@@ -98,3 +132,60 @@ def test_delay_node_inserts_delayed_impulse():
     # (the input at sample 0 appears in the output at sample delay_samples)
     assert out.data[delay_samples, 0] > 0.5
 
+
+# 10 samples exercises the lfilter comb path, 48 the slice-based path.
+@pytest.mark.parametrize("delay_samples", [10, 48])
+def test_delay_node_feedback_repeats_within_block(delay_samples):
+    sample_rate = 48_000
+    num_frames = 256  # several echoes fit inside one block
+
+    data = np.zeros((num_frames, 1), dtype=np.float32)
+    data[0, 0] = 1.0
+    frame = AudioFrame(data=data, sample_rate=sample_rate, timestamp=0.0)
+
+    delay = DelayNode(
+        name="delay_fb_test",
+        sample_rate=sample_rate,
+        channels=1,
+        config={"delay_ms": delay_samples * 1000.0 / sample_rate, "feedback": 0.5, "mix": 1.0},
+    )
+
+    out = delay.process(num_frames=num_frames, timestamp=0.0, inputs=[frame])
+
+    echoes = out.data[::delay_samples, 0][1:4]
+    np.testing.assert_allclose(echoes, [1.0, 0.5, 0.25], atol=1e-6)
+    assert np.count_nonzero(out.data) == num_frames // delay_samples
+
+
+@pytest.mark.parametrize(
+    "node_cls, config",
+    [
+        (GainNode, {"gain_db": 3.0}),
+        (EQNode, {"high_gain_db": 6.0}),
+        (DelayNode, {"delay_ms": 0.2, "feedback": 0.5}),
+        (DelayNode, {"delay_ms": 10.0, "feedback": 0.5}),
+    ],
+)
+def test_dsp_nodes_keep_float32(node_cls, config):
+    frame = AudioFrame(data=np.ones((256, 2), dtype=np.float32), sample_rate=48_000, timestamp=0.0)
+    node = node_cls(name="dtype_test", sample_rate=48_000, channels=2, config=config)
+    out = node.process(num_frames=256, timestamp=0.0, inputs=[frame])
+    assert out.data.dtype == np.float32
+
+
+@pytest.mark.parametrize("amplitude, overshoots", [(1.0, True), (0.25, False)])
+def test_audio_file_source_resampled_pcm16_is_not_clipped(tmp_path, amplitude, overshoots):
+    sf = pytest.importorskip("soundfile")
+    # A square wave rings past its amplitude once resampled 44.1 -> 48 kHz.
+    square = np.where(np.arange(4410) % 100 < 50, amplitude, -amplitude)
+    path = tmp_path / "square.wav"
+    sf.write(path, np.stack([square, square], axis=1), 44_100, subtype="PCM_16")
+
+    node = AudioFileSourceNode(name="file", sample_rate=48_000, channels=2, config={"file_path": str(path)})
+    out = node.process(num_frames=node._num_samples, timestamp=0.0).data
+
+    expected_peak = np.abs(signal.resample_poly(square, 480, 441, window=("kaiser", 5.0))).max()
+    assert (expected_peak > 1.0) == overshoots
+    assert np.isclose(np.abs(out).max(), expected_peak, atol=1e-3)
+    # Only signals that fit the int16 range are stored as int16.
+    assert (node._audio_data.dtype == np.int16) == (not overshoots)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
-from aers.core.graph_engine import GraphEngine, Connection
+from aers.core.graph_engine import GraphEngine, Connection, NodeSpec
 
 
 def _make_simple_engine() -> GraphEngine:
@@ -55,3 +56,102 @@ def test_process_frame_shapes_and_peaks():
     # bus_main should have a lower peak than source1 due to negative gain
     assert bus.peak < src.peak
 
+
+def test_process_frame_mixes_fan_in_inputs():
+    node_specs = [
+        {"id": "a", "kind": "sine", "params": {"frequency_hz": 440.0, "amplitude": 0.2}},
+        {"id": "b", "kind": "sine", "params": {"frequency_hz": 440.0, "amplitude": 0.2}},
+        {"id": "mix", "kind": "passthrough"},
+    ]
+    connections = [Connection(src="a", dst="mix"), Connection(src="b", dst="mix")]
+    engine = GraphEngine(
+        sample_rate=48000,
+        frame_size=256,
+        node_specs=node_specs,
+        connections=connections,
+    )
+
+    frames = engine.process_frame(frame_index=0)
+
+    assert list(frames.keys()) == list(engine.execution_order)
+    np.testing.assert_allclose(frames["mix"].data, frames["a"].data + frames["b"].data, atol=1e-6)
+
+
+def test_graph_state_tracks_layout_changes():
+    engine = _make_simple_engine()
+    state = engine.get_graph_state()
+
+    assert engine.get_graph_state() == state
+
+    engine.set_node_position("source1", 10.0, 20.0)
+    updated = engine.get_graph_state()
+
+    assert updated["layout_version"] == state["layout_version"] + 1
+    assert updated["nodes"][0]["position"] == {"x": 10.0, "y": 20.0}
+    assert [n["kind"] for n in updated["nodes"]] == ["sine", "gain"]
+
+
+def test_graph_state_mutation_does_not_leak_into_later_calls():
+    engine = _make_simple_engine()
+    state = engine.get_graph_state()
+    expected = engine.get_graph_state()
+
+    state["selected"] = "source1"
+    state["nodes"].append({"id": "ghost"})
+    state["connections"].clear()
+
+    assert engine.get_graph_state() == expected
+    assert "selected" not in engine.get_graph_state()
+
+
+def test_run_batched_matches_per_frame_run():
+    def make_engine() -> GraphEngine:
+        node_specs = [
+            {"id": "src", "kind": "sine", "params": {"frequency_hz": 220.0, "amplitude": 0.5}},
+            {"id": "echo", "kind": "delay", "params": {"delay_ms": 3.0, "feedback": 0.4, "mix": 0.5}},
+            {"id": "out", "kind": "gain", "params": {"gain_db": -6.0}},
+        ]
+        connections = [Connection(src="src", dst="echo"), Connection(src="echo", dst="out")]
+        return GraphEngine(sample_rate=48000, frame_size=128, node_specs=node_specs, connections=connections)
+
+    expected = make_engine().run(num_frames=10)
+    batched = make_engine().run_batched(num_frames=10, block_multiplier=4)
+
+    assert expected.keys() == batched.keys()
+    for nid, frame in expected.items():
+        assert batched[nid].data.shape == frame.data.shape
+        assert batched[nid].timestamp == frame.timestamp
+        np.testing.assert_allclose(batched[nid].data, frame.data, atol=1e-5)
+
+
+def test_node_spec_from_dict_canonicalizes_config_entry():
+    spec = NodeSpec.from_dict(
+        {"id": "bus_main", "kind": "gain", "params": {"gain_db": -3.0}, "position": [10, 20]}
+    )
+    assert spec == NodeSpec(id="bus_main", kind="gain", params={"gain_db": -3.0}, position=(10.0, 20.0))
+    assert NodeSpec.from_dict(spec.to_dict()) == spec
+
+    engine = GraphEngine(sample_rate=48000, frame_size=128, node_specs=[spec], connections=[])
+    assert engine.process_frame(frame_index=0)["bus_main"].data.shape == (128, 2)
+
+
+def test_frame_peak_follows_pooled_buffer_reuse():
+    engine = _make_simple_engine()
+    first = engine.process_frame(frame_index=0)["source1"]
+    assert first.peak == float(np.abs(first.data).max())
+
+    engine.process_frame(frame_index=1)
+    third = engine.process_frame(frame_index=2)["source1"]
+    # Output slots are reused, so the first frame now views the third block.
+    assert np.shares_memory(first.data, third.data)
+
+    first.data[:] = 0.0
+    first.data[3, 1] = -0.75
+    assert first.peak == 0.75
+
+
+def test_node_spec_from_dict_rejects_invalid_entries():
+    with pytest.raises(ValueError, match="missing key"):
+        NodeSpec.from_dict({"kind": "gain"})
+    with pytest.raises(TypeError, match="params must be a mapping"):
+        NodeSpec.from_dict({"id": "bus_main", "kind": "gain", "params": [("gain_db", -3.0)]})
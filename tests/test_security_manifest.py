@@ -0,0 +1,139 @@
+# tests/test_security_manifest.py
+
+import hashlib
+import os
+import time
+
+import pytest
+import yaml
+
+from aers import modules
+from aers.security import manifest as manifest_mod
+from aers.security.manifest import _hash_directory_sha256, directory_signature
+
+
+def _write_plugin(root):
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "gain.py").write_text("GAIN = 1.0\n")
+    (root / "README.txt").write_text("example plugin\n")
+
+
+def _age_tree(*paths, seconds=60):
+    """Backdate mtimes, as for a plugin installed a while ago."""
+    past = time.time() - seconds
+    for top in paths:
+        for dirpath, _, filenames in os.walk(top):
+            for name in filenames:
+                os.utime(os.path.join(dirpath, name), (past, past))
+        if top.is_file():
+            os.utime(top, (past, past))
+
+
+def test_directory_hash_is_deterministic_per_file_fold(tmp_path):
+    _write_plugin(tmp_path)
+
+    digest = hashlib.sha256()
+    for rel in ("README.txt", os.path.join("pkg", "__init__.py"), os.path.join("pkg", "gain.py")):
+        digest.update(rel.encode("utf-8"))
+        digest.update(hashlib.sha256((tmp_path / rel).read_bytes()).digest())
+
+    assert _hash_directory_sha256(tmp_path) == digest.hexdigest()
+    assert _hash_directory_sha256(tmp_path) == _hash_directory_sha256(tmp_path)
+
+
+def test_directory_hash_mmap_path_matches_read_path(tmp_path, monkeypatch):
+    _write_plugin(tmp_path)
+    (tmp_path / "pkg" / "weights.bin").write_bytes(os.urandom(50_000))
+    read_hash = _hash_directory_sha256(tmp_path)
+
+    monkeypatch.setattr(manifest_mod, "_MMAP_THRESHOLD", 1)
+    assert _hash_directory_sha256(tmp_path) == read_hash
+
+
+def test_directory_hash_changes_when_files_are_added_or_removed(tmp_path):
+    _write_plugin(tmp_path)
+    original = _hash_directory_sha256(tmp_path)
+
+    extra = tmp_path / "pkg" / "extra.py"
+    extra.write_text("")
+    assert _hash_directory_sha256(tmp_path) != original
+
+    extra.unlink()
+    assert _hash_directory_sha256(tmp_path) == original
+
+    (tmp_path / "README.txt").unlink()
+    assert _hash_directory_sha256(tmp_path) != original
+
+
+def test_directory_hash_skips_pycache_hidden_and_symlinked_dirs(tmp_path):
+    plugin = tmp_path / "plugin"
+    _write_plugin(plugin)
+    original = _hash_directory_sha256(plugin)
+
+    (plugin / "pkg" / "__pycache__").mkdir()
+    (plugin / "pkg" / "__pycache__" / "gain.cpython-311.pyc").write_bytes(b"\0" * 16)
+    (plugin / ".git").mkdir()
+    (plugin / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (plugin / ".hidden").write_text("")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "other.py").write_text("")
+    os.symlink(outside, plugin / "linked_dir", target_is_directory=True)
+
+    assert _hash_directory_sha256(plugin) == original
+    assert [entry[0] for entry in directory_signature(plugin)] == [
+        "README.txt",
+        os.path.join("pkg", "__init__.py"),
+        os.path.join("pkg", "gain.py"),
+    ]
+
+    # A symlinked file is still hashed, by its target's contents.
+    os.symlink(outside / "other.py", plugin / "linked.py")
+    assert _hash_directory_sha256(plugin) != original
+
+
+def _install_plugin(tmp_path, monkeypatch):
+    plugin_root = tmp_path / "plugins"
+    plugin_dir = plugin_root / "example_plugin"
+    _write_plugin(plugin_dir)
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(yaml.safe_dump({
+        "name": "example_plugin",
+        "version": "1.0.0",
+        "module": "aers_plugins.example_plugin",
+        "hash": {"algorithm": "sha256", "value": _hash_directory_sha256(plugin_dir)},
+        "allowed_node_kinds": ["gain"],
+    }))
+    monkeypatch.setattr(modules, "DEFAULT_PLUGIN_ROOT", plugin_root)
+    monkeypatch.setattr(modules, "_VERIFIED_MANIFESTS", {})
+    return manifest_path, plugin_dir
+
+
+def test_tampered_plugin_fails_after_cached_verification(tmp_path, monkeypatch):
+    manifest_path, plugin_dir = _install_plugin(tmp_path, monkeypatch)
+    _age_tree(plugin_dir, manifest_path)
+
+    modules._load_and_verify_plugin_manifest(str(manifest_path))
+    assert modules._VERIFIED_MANIFESTS  # verified and cached
+    modules._load_and_verify_plugin_manifest(str(manifest_path))
+
+    # Same-size edit: only the mtime and contents change.
+    (plugin_dir / "pkg" / "gain.py").write_text("GAIN = 9.0\n")
+    with pytest.raises(ValueError, match="hash mismatch"):
+        modules._load_and_verify_plugin_manifest(str(manifest_path))
+
+
+def test_recently_modified_plugin_is_not_cached(tmp_path, monkeypatch):
+    manifest_path, plugin_dir = _install_plugin(tmp_path, monkeypatch)
+
+    modules._load_and_verify_plugin_manifest(str(manifest_path))
+    assert modules._VERIFIED_MANIFESTS == {}
+
+    # Rewritten immediately, possibly within the same mtime tick.
+    gain = plugin_dir / "pkg" / "gain.py"
+    st = gain.stat()
+    gain.write_text("GAIN = 9.0\n")
+    os.utime(gain, ns=(st.st_atime_ns, st.st_mtime_ns))
+    with pytest.raises(ValueError, match="hash mismatch"):
+        modules._load_and_verify_plugin_manifest(str(manifest_path))
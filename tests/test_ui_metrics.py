@@ -0,0 +1,84 @@
+# tests/test_ui_metrics.py
+
+import dataclasses
+
+import numpy as np
+import orjson
+import pytest
+
+from aers.core.events import AudioFrame
+from aers.ui.metrics import (
+    _METRICS_CHUNK,
+    _STACK_MIN_FRAMES,
+    MetricsSnapshot,
+    encode_batch,
+    frame_to_metrics,
+    frames_to_metrics,
+)
+
+
+def _frame(rng, num_frames, num_channels=2, scale=0.5):
+    data = (rng.standard_normal((num_frames, num_channels)) * scale).astype(np.float32)
+    return AudioFrame(data=data, sample_rate=48000, timestamp=0.0)
+
+
+def _mixed_block_frames():
+    rng = np.random.default_rng(7)
+    frames = {}
+    # Enough same-shape frames to take the stacked path, interleaved with
+    # shapes that go per frame (small group, oversized, empty).
+    for i in range(_STACK_MIN_FRAMES + 2):
+        frames[f"bus{i}"] = _frame(rng, 256, scale=0.1 * (i + 1))
+        if i == 1:
+            frames["mono"] = _frame(rng, 256, num_channels=1)
+    frames["big"] = _frame(rng, _METRICS_CHUNK + 100)
+    frames["silent"] = AudioFrame(data=np.zeros((0, 2), np.float32), sample_rate=48000, timestamp=0.0)
+    return frames
+
+
+def test_frames_to_metrics_matches_per_frame_metrics():
+    frames = _mixed_block_frames()
+    metrics = frames_to_metrics(frames)
+
+    assert [m.name for m in metrics] == list(frames)
+    for metric in metrics:
+        frame = frames[metric.name]
+        expected = frame_to_metrics(metric.name, frame)
+        assert metric.num_frames == expected.num_frames == frame.num_frames
+        assert metric.num_channels == expected.num_channels == frame.num_channels
+        assert metric.file_info is None
+        assert float(metric.peak) == pytest.approx(float(expected.peak), rel=1e-6)
+        assert float(metric.rms) == pytest.approx(float(expected.rms), rel=1e-5)
+
+        samples = frame.data.astype(np.float64)
+        if samples.size:
+            assert float(metric.peak) == pytest.approx(np.abs(samples).max(), rel=1e-6)
+            assert float(metric.rms) == pytest.approx(np.sqrt(np.mean(samples ** 2)), rel=1e-5)
+        else:
+            assert float(metric.peak) == float(metric.rms) == 0.0
+
+
+def test_encoded_batch_has_the_schema_the_dashboard_reads():
+    metrics = frames_to_metrics(_mixed_block_frames())
+    file_info = {"file_path": "clip.wav", "duration": 1.5}
+    metrics[0] = dataclasses.replace(metrics[0], file_info=file_info)
+    snapshots = [
+        MetricsSnapshot(timestamp=1700000000.0, nodes=metrics),
+        MetricsSnapshot(timestamp=1700000000.5, nodes=metrics[:1]),
+    ]
+
+    decoded = orjson.loads(encode_batch(snapshots))
+
+    assert list(decoded) == ["batch"]
+    assert [s["timestamp"] for s in decoded["batch"]] == [1700000000.0, 1700000000.5]
+    nodes = decoded["batch"][0]["nodes"]
+    assert [n["name"] for n in nodes] == [m.name for m in metrics]
+    for node, metric in zip(nodes, metrics):
+        assert set(node) == {"name", "peak", "rms", "num_frames", "num_channels", "file_info"}
+        assert isinstance(node["peak"], float) and isinstance(node["rms"], float)
+        assert node["peak"] == pytest.approx(float(metric.peak))
+        assert node["rms"] == pytest.approx(float(metric.rms))
+        assert node["num_frames"] == metric.num_frames
+        assert node["num_channels"] == metric.num_channels
+    assert nodes[0]["file_info"] == file_info
+    assert all(n["file_info"] is None for n in nodes[1:])
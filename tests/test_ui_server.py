@@ -0,0 +1,105 @@
+# tests/test_ui_server.py
+
+import asyncio
+import importlib
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+
+from aers.ui.metrics import MetricsSnapshot
+from aers.utils.config_loader import load_routing_config
+
+CONFIGS_DIR = Path(__file__).resolve().parents[1] / "configs"
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    # The server module creates logs/ and uploads/ relative to the working
+    # directory on import; keep them out of the checkout.
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("aers.ui.server")
+    monkeypatch.setattr(module, "_metrics_clients", set())
+    return module
+
+
+class _FakeSocket:
+    def __init__(self, stall: bool = False) -> None:
+        self.stall = stall
+        self.sent = []
+        self.close_codes = []
+
+    async def send_bytes(self, payload: bytes) -> None:
+        if self.stall:
+            await asyncio.Event().wait()
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_codes.append(code)
+
+
+def test_broadcast_drops_and_closes_stalled_client(server):
+    fast, stalled = _FakeSocket(), _FakeSocket(stall=True)
+    server._metrics_clients.update({fast, stalled})
+
+    async def run():
+        await server._broadcast_snapshots([MetricsSnapshot(timestamp=0.0, nodes=[])], send_timeout=0.01)
+        # Let the background close run
+        await asyncio.gather(*server._closing_tasks)
+
+    asyncio.run(run())
+
+    assert server._metrics_clients == {fast}
+    assert len(fast.sent) == 1
+    assert stalled.close_codes == [1013]
+    assert fast.close_codes == []
+
+
+class _FakeRequest:
+    def __init__(self, body: dict) -> None:
+        self.body = body
+
+    async def json(self) -> dict:
+        return self.body
+
+
+def test_uploaded_config_stays_in_memory_and_graph_edits_build_on_it(server, tmp_path, monkeypatch):
+    shutil.copytree(CONFIGS_DIR, tmp_path / "configs")
+    (tmp_path / "uploads").mkdir(exist_ok=True)
+    started = []
+
+    async def fake_loop(config_path, routing_config=None, **kwargs):
+        started.append((config_path, routing_config))
+
+    monkeypatch.setattr(server, "_simulation_loop", fake_loop)
+    monkeypatch.setattr(server, "_simulation_task", None)
+    monkeypatch.setattr(server, "_current_config_path", server.DEFAULT_CONFIG_PATH)
+    monkeypatch.setattr(server, "_current_routing_config", None)
+    monkeypatch.setattr(server, "_routing_config_cache", None)
+    monkeypatch.setattr(server, "_audio_index", {})
+
+    async def run():
+        await server.upload_audio(UploadFile(io.BytesIO(b"RIFF"), filename="clip.wav"))
+        await server._simulation_task
+        # No config file exists for the upload; the edit must still see it.
+        assert list((tmp_path / "uploads").glob("*.yaml")) == []
+        assert server._current_config_path is None
+        await server.add_node(_FakeRequest({"id": "extra", "kind": "gain"}))
+        await server._simulation_task
+
+    asyncio.run(run())
+
+    upload_path, upload_config = started[0]
+    assert upload_path is None
+    assert [spec.kind for spec in upload_config.node_specs] == ["audio_file", "gain"]
+
+    edit_path, edit_config = started[1]
+    assert edit_config is None
+    assert Path(edit_path).parent == Path("uploads")
+    saved = load_routing_config(edit_path)
+    assert [spec.id for spec in saved.node_specs] == ["source1", "bus_main", "extra"]
+    assert saved.node_specs[0].kind == "audio_file"
+    assert server._current_config_path == edit_path
+    assert server._current_routing_config is None
@@ -366,9 +366,13 @@
     }
   }
 
+  const snapshotDecoder = new TextDecoder();
+
   function connect() {
     console.log("Connecting to WebSocket:", WS_URL);
     const ws = new WebSocket(WS_URL);
+    // Snapshots arrive as binary frames holding UTF-8 JSON
+    ws.binaryType = "arraybuffer";
 
     ws.onopen = () => {
       console.log("WebSocket connected");
@@ -383,8 +387,10 @@
 
     ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data);
-        handleSnapshot(data);
+        const text = typeof event.data === "string" ? event.data : snapshotDecoder.decode(event.data);
+        const data = JSON.parse(text);
+        // The server coalesces backlogged snapshots into {"batch": [...]}, oldest first
+        data.batch.forEach(handleSnapshot);
       } catch (e) {
         console.error("Failed to parse snapshot:", e);
       }